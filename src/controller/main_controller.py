@@ -49,9 +49,7 @@ class MainController(QObject):
     def initialize(self) -> None:
         """Initialize controllers and connect signals"""
         # Pass settings to recording panel for custom presets
-        self._window.recording_panel._app_settings = self._settings
-        self._window.recording_panel._preset_combo.clear()
-        self._window.recording_panel._populate_presets()
+        self._window.recording_panel.set_app_settings(self._settings)
 
         # Create sub-controllers
         self._recording_controller = RecordingController(
@@ -189,9 +187,7 @@ class MainController(QObject):
         dialog.exec()
 
         # Refresh recording panel presets after dialog closes
-        self._window.recording_panel._app_settings = self._settings
-        self._window.recording_panel._preset_combo.clear()
-        self._window.recording_panel._populate_presets()
+        self._window.recording_panel.set_app_settings(self._settings)
 
     def _on_codec_config_changed(self, codec_config) -> None:
         """Handle codec config change from settings
@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, Slot
 from PySide6.QtWidgets import QInputDialog, QMessageBox
 
 from src.model.codec_config import CodecConfig, CodecPresets
@@ -59,6 +59,7 @@ class MemoController(QObject):
         self._manager.memo_added.connect(self._on_memo_added)
         self._manager.memo_removed.connect(self._on_memo_removed)
         self._manager.memo_updated.connect(self._on_memo_updated)
+        self._manager.scan_completed.connect(self._on_rescan_completed)
 
         # Converter signals
         self._converter.conversion_completed.connect(self._on_conversion_completed)
@@ -260,6 +261,15 @@ class MemoController(QObject):
         """
         self._refresh_list()
 
+    @Slot(int)
+    def _on_rescan_completed(self, count: int) -> None:
+        """Refresh the list whenever a memo scan finishes
+
+        Args:
+            count: Number of memos found (unused; the list is rebuilt)
+        """
+        self._refresh_list()
+
     def _on_conversion_completed(self, input_path: str, output_path: str) -> None:
         """Handle conversion completed
 
@@ -267,9 +277,8 @@ class MemoController(QObject):
             input_path: Input file path
             output_path: Output file path
         """
-        # Add converted file to memo list
-        self._manager.scan_directory()
-        self._refresh_list()
+        # Add converted file to memo list (probing runs in the background)
+        self._manager.scan_directory_async()
 
         # Show notification
         QMessageBox.information(
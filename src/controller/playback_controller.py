@@ -1,14 +1,15 @@
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, Slot
 
 from src.model.audio_player import AudioPlayer
 from src.model.memo_manager import VoiceMemo
 from src.model.spectrogram_data import SpectrogramData, SpectrogramWorker
-from src.model.viewport_state import ViewportState
+from src.model.viewport_state import WAVEFORM_RESOLUTIONS, ViewportState
 from src.model.waveform_data import WaveformData
+from src.utils.ffmpeg_task import FFmpegTask
 from src.view.playback_widget import PlaybackWidget
 from src.view.spectrogram_widget import SpectrogramWidget
 from src.view.waveform_widget import WaveformWidget
@@ -46,6 +47,10 @@ class PlaybackController(QObject):
         self._waveform_data: Optional[WaveformData] = None
         self._spectrogram_data: Optional[SpectrogramData] = None
         self._spectrogram_worker: Optional[SpectrogramWorker] = None
+        self._waveform_task: Optional[FFmpegTask] = None
+        # Spectrogram waiting to reuse the waveform task's decode
+        self._spectrogram_pending = False
+        self._load_generation = 0  # Bumped per load/unload to drop stale tasks
 
         # Create shared viewport state for synchronized zoom/pan
         self._viewport_state = ViewportState(self)
@@ -112,21 +117,90 @@ class PlaybackController(QObject):
         # Reset viewport to fit-all for new file
         self._viewport_state.reset()
 
-        # Load waveform and spectrogram with resolutions matching the initial zoom level (1.0)
-        initial_resolution = self._viewport_state.get_recommended_resolution()
-        initial_hop_length = self._viewport_state.get_recommended_hop_length()
-
-        # Load waveform (fast, keep synchronous)
-        self._load_waveform(file_path, resolution=initial_resolution)
-
-        # Load spectrogram asynchronously
-        self._load_spectrogram_async(file_path, hop_length=initial_hop_length)
+        # Build every waveform zoom tier from a single extraction so later
+        # zoom changes don't re-run FFmpeg. The decode runs on the thread pool;
+        # the waveform is loaded once it is done, at the zoom level current
+        # then (_waveform_data stays unset until then).
+        self._waveform_data = None
+        self._waveform_widget.set_waveform_data(None)
+
+        self._load_generation += 1
+        generation = self._load_generation
+        waveform_data = WaveformData(file_path)
+        spectrogram_data = SpectrogramData(file_path)
+
+        # A cached spectrogram needs no decode, so load it right away instead
+        # of waiting on the waveform; otherwise share the waveform's decode
+        share_decode = not spectrogram_data.is_cached()
+        self._spectrogram_pending = share_decode
+        if share_decode:
+            self._spectrogram.set_loading_state(True)
+        else:
+            self._load_spectrogram_async(
+                file_path, hop_length=self._viewport_state.get_recommended_hop_length()
+            )
+
+        def build_tiers() -> tuple:
+            audio = None
+            built = False
+            try:
+                if share_decode and not waveform_data.is_cached(
+                    max(WAVEFORM_RESOLUTIONS)
+                ):
+                    # Both views need a decode: decode at the spectrogram's
+                    # rate so they come from one FFmpeg run
+                    audio = spectrogram_data.decode_audio()
+                    if audio[0] is None or len(audio[0]) == 0:
+                        audio = None
+                built = waveform_data.build_pyramid(
+                    WAVEFORM_RESOLUTIONS, samples=audio[0] if audio else None
+                )
+            except Exception as e:
+                print(f"Failed to build waveform tiers: {e}")
+            return generation, waveform_data, audio, built
+
+        self._waveform_task = FFmpegTask(build_tiers)
+        self._waveform_task.signals.finished.connect(self._on_waveform_tiers_built)
+        self._waveform_task.start()
 
         # Enable playback controls immediately
         self._playback_widget.set_enabled(True)
 
         return True
 
+    @Slot(object)
+    def _on_waveform_tiers_built(self, result: tuple) -> None:
+        """Show the waveform, and start a pending spectrogram, once tiers are built
+
+        Args:
+            result: (generation, waveform_data, audio, built) from the task
+        """
+        generation, waveform_data, audio, built = result
+        if generation != self._load_generation:
+            return  # Another memo was loaded, or this one unloaded
+
+        self._waveform_task = None
+
+        # Resolutions match the current zoom level, which may have changed
+        # while the tiers were built
+        file_path = waveform_data.audio_file
+        if built:
+            self._waveform_data = waveform_data
+            self._load_waveform(
+                file_path, resolution=self._viewport_state.get_recommended_resolution()
+            )
+        else:
+            # Don't retry the decode on the GUI thread; leave the view empty
+            self._waveform_widget.set_waveform_data(None)
+
+        if self._spectrogram_pending:
+            self._spectrogram_pending = False
+            self._load_spectrogram_async(
+                file_path,
+                hop_length=self._viewport_state.get_recommended_hop_length(),
+                audio=audio,
+            )
+
     def play(self) -> None:
         """Start or resume playback"""
         if self._current_memo:
@@ -158,6 +232,10 @@ class PlaybackController(QObject):
             self._spectrogram_worker.wait()  # Wait for thread to finish
             self._spectrogram_worker = None
 
+        # Drop any waveform tiers still being built
+        self._load_generation += 1
+        self._spectrogram_pending = False
+
         self.stop()
         self._current_memo = None
         self._waveform_widget.clear()
@@ -172,7 +250,9 @@ class PlaybackController(QObject):
             resolution: Number of waveform samples to extract
         """
         try:
-            self._waveform_data = WaveformData(file_path)
+            # Reuse the loaded memo's extractor so its resolution tiers are served from memory
+            if self._waveform_data is None or self._waveform_data.audio_file != file_path:
+                self._waveform_data = WaveformData(file_path)
             waveform = self._waveform_data.extract_waveform(resolution=resolution)
 
             if waveform is not None:
@@ -189,12 +269,18 @@ class PlaybackController(QObject):
             print(f"Failed to load waveform: {e}")
             self._waveform_widget.set_waveform_data(None)
 
-    def _load_spectrogram_async(self, file_path: Path, hop_length: int = 1024) -> None:
+    def _load_spectrogram_async(
+        self,
+        file_path: Path,
+        hop_length: int = 1024,
+        audio: Optional[Tuple[np.ndarray, int]] = None,
+    ) -> None:
         """Load spectrogram in background thread
 
         Args:
             file_path: Audio file path
             hop_length: STFT hop length (smaller = better temporal resolution)
+            audio: Already-decoded (samples, sample_rate) to reuse (optional)
         """
         # Cancel any existing worker first
         if self._spectrogram_worker and self._spectrogram_worker.isRunning():
@@ -211,6 +297,7 @@ class PlaybackController(QObject):
             hop_length=hop_length,  # Vary hop length based on zoom
             freq_min=80.0,
             freq_max=8000.0,
+            audio=audio,
             parent=self  # Set parent for proper Qt lifecycle management
         )
 
@@ -290,7 +377,7 @@ class PlaybackController(QObject):
         Args:
             zoom_level: New zoom level
         """
-        if not self._current_memo or not self._waveform_data:
+        if not self._current_memo:
             return
 
         # Get recommended parameters for current zoom level
@@ -302,8 +389,13 @@ class PlaybackController(QObject):
         print(f"Zoom level changed to {zoom_level:.1f}x - re-extracting at higher resolution")
         print(f"  Waveform: {new_resolution} samples, Spectrogram: hop_length={new_hop_length}")
 
-        self._load_waveform(file_path, resolution=new_resolution)
-        self._load_spectrogram_async(file_path, hop_length=new_hop_length)
+        # Until the tiers are built, both views pick up the current zoom
+        # level when they load: skip the waveform, and a spectrogram that
+        # is still waiting on the shared decode
+        if self._waveform_data is not None:
+            self._load_waveform(file_path, resolution=new_resolution)
+        if not self._spectrogram_pending:
+            self._load_spectrogram_async(file_path, hop_length=new_hop_length)
 
     # Signal handlers
     def _on_playback_started(self) -> None:
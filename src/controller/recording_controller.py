@@ -56,8 +56,7 @@ class RecordingController(QObject):
         # Live waveform buffer (store last 1000 samples for visualization)
         self._waveform_buffer = deque(maxlen=1000)
 
-        # Live spectrogram buffer (store recent STFT slices)
-        self._spectrogram_buffer = []
+        # Live spectrogram history is kept by the widget (recent STFT slices)
         self._max_spectrogram_slices = 200  # ~10 seconds at 50ms updates
         self._frequency_bins = None  # Frequency bins for spectrogram
 
@@ -206,7 +205,6 @@ class RecordingController(QObject):
         self._update_timer.start()
 
         # Initialize spectrogram for recording
-        self._spectrogram_buffer.clear()
         self._frequency_bins = None
         self._spectrogram.set_recording_mode(True)
 
@@ -223,7 +221,6 @@ class RecordingController(QObject):
 
         # Clear the live buffers
         self._waveform_buffer.clear()
-        self._spectrogram_buffer.clear()
         self._frequency_bins = None
 
     def _on_recording_paused(self) -> None:
@@ -300,14 +297,7 @@ class RecordingController(QObject):
             mask = (all_freqs >= 80.0) & (all_freqs <= 8000.0)
             self._frequency_bins = all_freqs[mask]
 
-        # Add to buffer
-        self._spectrogram_buffer.append(magnitude_slice)
-
-        # Limit buffer size
-        if len(self._spectrogram_buffer) > self._max_spectrogram_slices:
-            self._spectrogram_buffer.pop(0)
-
-        # Update spectrogram widget
-        if len(self._spectrogram_buffer) > 0:
-            spec_matrix = np.array(self._spectrogram_buffer)
-            self._spectrogram.set_spectrogram_data(spec_matrix, self._frequency_bins)
+        # Append to the widget's live history (oldest slices drop off)
+        self._spectrogram.append_spectrogram_slice(
+            magnitude_slice, self._frequency_bins, self._max_spectrogram_slices
+        )
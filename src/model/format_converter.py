@@ -4,7 +4,7 @@ from typing import List, Optional
 from PySide6.QtCore import QObject, Signal
 
 from src.model.codec_config import CodecConfig
-from src.utils.ffmpeg_wrapper import FFmpegWrapper
+from src.utils.ffmpeg_wrapper import ConvertJob, FFmpegWrapper
 
 
 class FormatConverter(QObject):
@@ -135,6 +135,10 @@ class FormatConverter(QObject):
     ) -> int:
         """Convert multiple files to the same format
 
+        Blocks until every job has finished, so call it off the GUI thread
+        (e.g. through an FFmpegTask); signals are emitted from the calling
+        thread and reach GUI receivers as queued calls.
+
         Args:
             files: List of input files
             codec_config: Target codec configuration
@@ -143,8 +147,22 @@ class FormatConverter(QObject):
         Returns:
             Number of successful conversions
         """
-        success_count = 0
+        if self._is_converting:
+            for file_path in files:
+                self.conversion_failed.emit(
+                    str(file_path), "Another conversion is already in progress"
+                )
+            return 0
+
+        # Build conversion arguments
+        extra_args = []
+        if codec_config.compression_level is not None:
+            extra_args.extend(
+                ["-compression_level", str(codec_config.compression_level)]
+            )
 
+        jobs = []
+        claimed_outputs = set()
         for file_path in files:
             if not file_path.exists():
                 continue
@@ -157,9 +175,50 @@ class FormatConverter(QObject):
             else:
                 output_path = file_path.with_suffix(codec_config.get_extension())
 
-            # Convert
-            if self.convert(file_path, output_path, codec_config):
+            # Jobs run concurrently, so two writing one file would corrupt it
+            output_key = output_path.resolve()
+            if output_key in claimed_outputs:
+                self.conversion_failed.emit(
+                    str(file_path),
+                    f"{output_path.name} is already an output of this batch",
+                )
+                continue
+            claimed_outputs.add(output_key)
+
+            jobs.append(
+                ConvertJob(
+                    input_path=file_path,
+                    output_path=output_path,
+                    codec=codec_config.get_ffmpeg_encoder(),
+                    sample_rate=codec_config.sample_rate,
+                    bit_rate=codec_config.bit_rate,
+                    channels=codec_config.channels,
+                    extra_args=extra_args if extra_args else None,
+                )
+            )
+
+        if not jobs:
+            return 0
+
+        # Run the conversions concurrently; signals are emitted from this thread
+        try:
+            self._is_converting = True
+            for job in jobs:
+                self.conversion_started.emit(str(job.input_path))
+
+            results = self._ffmpeg.convert_format_batch(jobs)
+        finally:
+            self._is_converting = False
+
+        success_count = 0
+        for job, (success, error_msg) in zip(jobs, results):
+            if success:
                 success_count += 1
+                self.conversion_completed.emit(
+                    str(job.input_path), str(job.output_path)
+                )
+            else:
+                self.conversion_failed.emit(str(job.input_path), error_msg)
 
         return success_count
 
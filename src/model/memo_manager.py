@@ -3,12 +3,28 @@ import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, Slot
 
+from src.utils.ffmpeg_task import FFmpegTask
 from src.utils.ffmpeg_wrapper import FFmpegWrapper
 
+# Audio file extensions picked up by MemoManager.scan_directory
+_AUDIO_EXTENSIONS = frozenset(
+    {
+        ".wav",
+        ".mp3",
+        ".m4a",
+        ".aac",
+        ".opus",
+        ".ogg",
+        ".flac",
+        ".spx",
+        ".amr",
+    }
+)
+
 
 @dataclass
 class VoiceMemo:
@@ -59,49 +75,105 @@ class MemoManager(QObject):
         self._ffmpeg = FFmpegWrapper()
         self._memos: dict[str, VoiceMemo] = {}
 
+        # Background rescan state (see scan_directory_async)
+        self._scan_generation = 0
+        self._scan_task: Optional[FFmpegTask] = None
+
         # Initial scan
         self.scan_directory()
 
     def scan_directory(self) -> int:
         """Scan storage directory for audio files
 
+        Returns:
+            Number of memos found
+        """
+        audio_files = self._find_audio_files()
+
+        # Probe every file in one concurrent batch rather than one at a time
+        audio_infos = self._ffmpeg.get_audio_info_batch(audio_files)
+
+        return self._populate_memos(audio_files, audio_infos)
+
+    def scan_directory_async(self) -> None:
+        """Rescan the storage directory with ffprobe off the GUI thread
+
+        scan_completed is emitted once the memo list has been rebuilt.
+        A newer scan supersedes one still in flight.
+        """
+        audio_files = self._find_audio_files()
+        self._scan_generation += 1
+        generation = self._scan_generation
+
+        def probe() -> tuple:
+            return generation, audio_files, self._ffmpeg.get_audio_info_batch(
+                audio_files
+            )
+
+        self._scan_task = FFmpegTask(probe)
+        self._scan_task.signals.finished.connect(self._on_scan_probed)
+        self._scan_task.start()
+
+    @Slot(object)
+    def _on_scan_probed(self, result: tuple) -> None:
+        """Rebuild memos from a finished background scan
+
+        Args:
+            result: (generation, audio_files, audio_infos) from the task
+        """
+        generation, audio_files, audio_infos = result
+        if generation != self._scan_generation:
+            return  # A newer scan is in flight
+
+        self._scan_task = None
+        self._populate_memos(audio_files, audio_infos)
+
+    def _find_audio_files(self) -> List[Path]:
+        """List audio files in the storage directory
+
+        Returns:
+            Paths of files with a known audio extension
+        """
+        return [
+            file_path
+            for file_path in self.storage_dir.iterdir()
+            if file_path.is_file() and file_path.suffix.lower() in _AUDIO_EXTENSIONS
+        ]
+
+    def _populate_memos(
+        self, audio_files: List[Path], audio_infos: Dict[Path, dict]
+    ) -> int:
+        """Replace the memo set with memos built from probed files
+
+        Args:
+            audio_files: Audio file paths
+            audio_infos: get_audio_info() result per path
+
         Returns:
             Number of memos found
         """
         self._memos.clear()
 
-        # Audio file extensions
-        audio_extensions = {
-            ".wav",
-            ".mp3",
-            ".m4a",
-            ".aac",
-            ".opus",
-            ".ogg",
-            ".flac",
-            ".spx",
-            ".amr",
-        }
-
-        # Find all audio files
-        for file_path in self.storage_dir.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in audio_extensions:
-                try:
-                    memo = self._create_memo_from_file(file_path)
-                    if memo:
-                        self._memos[memo.id] = memo
-                except Exception as e:
-                    print(f"Warning: Failed to process {file_path}: {e}")
+        for file_path in audio_files:
+            try:
+                memo = self._create_memo_from_file(file_path, audio_infos[file_path])
+                if memo:
+                    self._memos[memo.id] = memo
+            except Exception as e:
+                print(f"Warning: Failed to process {file_path}: {e}")
 
         count = len(self._memos)
         self.scan_completed.emit(count)
         return count
 
-    def _create_memo_from_file(self, file_path: Path) -> Optional[VoiceMemo]:
+    def _create_memo_from_file(
+        self, file_path: Path, audio_info: Optional[dict] = None
+    ) -> Optional[VoiceMemo]:
         """Create VoiceMemo object from audio file
 
         Args:
             file_path: Path to audio file
+            audio_info: Pre-fetched get_audio_info() result (optional)
 
         Returns:
             VoiceMemo object or None if failed
@@ -113,8 +185,9 @@ class MemoManager(QObject):
             created_at = datetime.fromtimestamp(stats.st_ctime)
             modified_at = datetime.fromtimestamp(stats.st_mtime)
 
-            # Get audio info from FFmpeg
-            audio_info = self._ffmpeg.get_audio_info(file_path)
+            # Get audio info from FFmpeg unless already probed
+            if audio_info is None:
+                audio_info = self._ffmpeg.get_audio_info(file_path)
 
             # Create memo
             memo = VoiceMemo(
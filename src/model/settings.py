@@ -108,11 +108,12 @@ class AppSettings:
         keys = key.split(".")
         value = self._settings
 
-        for k in keys:
-            if isinstance(value, dict) and k in value:
+        # EAFP: keys usually exist, so skip per-level type/membership checks
+        try:
+            for k in keys:
                 value = value[k]
-            else:
-                return default
+        except (KeyError, TypeError):
+            return default
 
         return value
 
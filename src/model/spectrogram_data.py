@@ -24,6 +24,7 @@ class SpectrogramWorker(QThread):
         hop_length: int = 1024,
         freq_min: float = 80.0,
         freq_max: float = 8000.0,
+        audio: Optional[Tuple[np.ndarray, int]] = None,
         parent: Optional[QObject] = None
     ):
         """Initialize spectrogram worker
@@ -34,6 +35,9 @@ class SpectrogramWorker(QThread):
             hop_length: Hop size between frames
             freq_min: Minimum frequency (Hz)
             freq_max: Maximum frequency (Hz)
+            audio: Already-decoded (samples, sample_rate) from
+                SpectrogramData.decode_audio, used instead of re-running
+                FFmpeg on a cache miss (optional)
             parent: Parent QObject
         """
         super().__init__(parent)
@@ -42,6 +46,7 @@ class SpectrogramWorker(QThread):
         self._hop_length = hop_length
         self._freq_min = freq_min
         self._freq_max = freq_max
+        self._audio = audio
         self._cancelled = False
 
     def run(self) -> None:
@@ -67,21 +72,12 @@ class SpectrogramWorker(QThread):
             if self._cancelled:
                 return
 
-            self.progress_updated.emit("Extracting audio data...")
-
-            ffmpeg = FFmpegWrapper()
-            audio_info = ffmpeg.get_audio_info(self._file_path)
-            file_sample_rate = audio_info.get("sample_rate", 48000)
-            target_sample_rate = min(file_sample_rate, 16000)
-
-            if self._cancelled:
-                return
-
-            audio_data = ffmpeg.extract_audio_samples(
-                self._file_path,
-                sample_rate=target_sample_rate,
-                channels=1
-            )
+            if self._audio is not None:
+                audio_data, sample_rate = self._audio
+            else:
+                self.progress_updated.emit("Extracting audio data...")
+                audio_data, sample_rate = spec_data.decode_audio()
+            self._audio = None  # Don't hold the decoded buffer past this run
 
             if self._cancelled or audio_data is None or len(audio_data) == 0:
                 self.computation_failed.emit("Failed to extract audio")
@@ -89,26 +85,20 @@ class SpectrogramWorker(QThread):
 
             self.progress_updated.emit("Computing spectrogram...")
 
-            # Compute STFT with medium quality settings
-            spectrogram, frequencies = AudioUtils.compute_stft(
+            # Compute STFT with medium quality settings and store on spec_data
+            spectrogram, frequencies = spec_data._compute_from_audio(
                 audio_data,
-                sample_rate=target_sample_rate,
+                sample_rate,
                 n_fft=self._n_fft,
                 hop_length=self._hop_length,
-                window="hann",
+                freq_min=self._freq_min,
+                freq_max=self._freq_max,
             )
 
             if self._cancelled:
                 return
 
-            # Filter to voice frequency range
-            spectrogram, frequencies = AudioUtils.filter_frequency_range(
-                spectrogram, frequencies, self._freq_min, self._freq_max
-            )
-
             # Save to cache for next time
-            spec_data._spectrogram = spectrogram
-            spec_data._frequency_bins = frequencies
             spec_data._save_to_cache(
                 n_fft=self._n_fft,
                 hop_length=self._hop_length,
@@ -178,7 +168,43 @@ class SpectrogramData(QObject):
         if use_cache and self._load_from_cache(n_fft, hop_length, freq_min, freq_max):
             return self._spectrogram, self._frequency_bins
 
-        # Extract audio data from file using FFmpeg
+        audio_data, sample_rate = self.decode_audio()
+
+        if audio_data is None or len(audio_data) == 0:
+            # Return empty spectrogram if extraction failed
+            return np.array([[]]), np.array([])
+
+        self._compute_from_audio(
+            audio_data, sample_rate, n_fft, hop_length, freq_min, freq_max
+        )
+
+        # Cache for future use with parameters
+        self._save_to_cache(n_fft, hop_length, freq_min, freq_max)
+
+        return self._spectrogram, self._frequency_bins
+
+    def is_cached(self) -> bool:
+        """Check whether a disk cache at least as new as the audio file exists
+
+        Only file times are compared; computation parameters are validated
+        when the cache is actually loaded.
+
+        Returns:
+            True if the spectrogram can likely be served without decoding audio
+        """
+        try:
+            return (
+                self._cache_file.stat().st_mtime >= self._file_path.stat().st_mtime
+            )
+        except OSError:
+            return False
+
+    def decode_audio(self) -> Tuple[Optional[np.ndarray], int]:
+        """Decode mono audio samples for STFT analysis
+
+        Returns:
+            Tuple of (audio_data, sample_rate); audio_data is None on failure
+        """
         ffmpeg = FFmpegWrapper()
 
         # Get file's actual sample rate
@@ -188,19 +214,37 @@ class SpectrogramData(QObject):
         # Use file's sample rate or downsample to 16kHz for efficiency if higher
         target_sample_rate = min(file_sample_rate, 16000)
 
-        # Get raw audio data
         audio_data = ffmpeg.extract_audio_samples(
             self._file_path, sample_rate=target_sample_rate, channels=1
         )
+        return audio_data, target_sample_rate
 
-        if audio_data is None or len(audio_data) == 0:
-            # Return empty spectrogram if extraction failed
-            return np.array([[]]), np.array([])
+    def _compute_from_audio(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        n_fft: int = 1024,
+        hop_length: int = 1024,
+        freq_min: float = 80.0,
+        freq_max: float = 8000.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the filtered spectrogram from raw samples and store it
+
+        Args:
+            audio_data: 1D array of mono audio samples
+            sample_rate: Sample rate of audio_data in Hz
+            n_fft: FFT window size
+            hop_length: Hop size between frames
+            freq_min: Minimum frequency to include (Hz)
+            freq_max: Maximum frequency to include (Hz)
 
+        Returns:
+            Tuple of (spectrogram, frequency_bins)
+        """
         # Compute STFT using the actual sample rate
         spectrogram, frequencies = AudioUtils.compute_stft(
             audio_data,
-            sample_rate=target_sample_rate,
+            sample_rate=sample_rate,
             n_fft=n_fft,
             hop_length=hop_length,
             window="hann",
@@ -215,10 +259,7 @@ class SpectrogramData(QObject):
         self._spectrogram = spectrogram
         self._frequency_bins = frequencies
 
-        # Cache for future use with parameters
-        self._save_to_cache(n_fft, hop_length, freq_min, freq_max)
-
-        return self._spectrogram, self._frequency_bins
+        return spectrogram, frequencies
 
     def _save_to_cache(
         self,
@@ -290,16 +331,16 @@ class SpectrogramData(QObject):
             with open(self._cache_file, "rb") as f:
                 cache_data = pickle.load(f)
 
-            # Validate file mtime
-            if cache_data.get("file_mtime") != file_mtime:
-                return False
-
-            # Validate computation parameters match
-            if (cache_data.get("n_fft") != n_fft or
-                cache_data.get("hop_length") != hop_length or
-                cache_data.get("freq_min") != freq_min or
-                cache_data.get("freq_max") != freq_max):
-                # Parameters don't match - need to recompute
+            # Validate file mtime and computation parameters in one subset check
+            expected = {
+                "file_mtime": file_mtime,
+                "n_fft": n_fft,
+                "hop_length": hop_length,
+                "freq_min": freq_min,
+                "freq_max": freq_max,
+            }
+            if not expected.items() <= cache_data.items():
+                # Stale cache or parameters don't match - need to recompute
                 return False
 
             self._spectrogram = cache_data["spectrogram"]
@@ -1,7 +1,13 @@
+import bisect
 from typing import Optional
 
-import numpy as np
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
+
+# Waveform resolution per zoom tier (see get_recommended_resolution)
+WAVEFORM_RESOLUTIONS = (1014, 2028, 4992, 9984)
+
+# Zoom levels at which the next resolution tier starts
+_ZOOM_TIER_THRESHOLDS = (2.0, 5.0, 10.0)
 
 
 class ViewportState(QObject):
@@ -32,6 +38,16 @@ class ViewportState(QObject):
         self._min_zoom = 1.0
         self._max_zoom = 50.0
 
+        # Coalesce bursts of zoom/pan changes (wheel, drag) into one
+        # viewport_changed emission per event-loop pass; zoom_level_changed
+        # follows it so tier reloads see the new viewport
+        self._emit_pending = False
+        self._zoom_tier_pending = False
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._flush_emit)
+
     @property
     def zoom_level(self) -> float:
         """Get current zoom level
@@ -67,7 +83,7 @@ class ViewportState(QObject):
             center_time: Normalized time (0.0-1.0) to keep at same screen position
         """
         # Clamp zoom to valid range
-        new_zoom = np.clip(zoom, self._min_zoom, self._max_zoom)
+        new_zoom = max(self._min_zoom, min(self._max_zoom, zoom))
 
         if new_zoom == self._zoom_level:
             return  # No change
@@ -82,7 +98,7 @@ class ViewportState(QObject):
         # Calculate position of center_time in current viewport (0.0-1.0 of viewport width)
         if self.visible_duration > 0:
             center_viewport_pos = (center_time - self._pan_offset) / self.visible_duration
-            center_viewport_pos = np.clip(center_viewport_pos, 0.0, 1.0)
+            center_viewport_pos = max(0.0, min(1.0, center_viewport_pos))
         else:
             center_viewport_pos = 0.5
 
@@ -91,13 +107,28 @@ class ViewportState(QObject):
 
         # Update state
         self._zoom_level = new_zoom
-        self._pan_offset = np.clip(new_pan_offset, 0.0, max(0.0, 1.0 - new_visible_duration))
-
-        self.viewport_changed.emit()
+        max_offset = max(0.0, 1.0 - new_visible_duration)
+        self._pan_offset = max(0.0, min(max_offset, new_pan_offset))
 
-        # Emit zoom level changed if we crossed a resolution threshold
+        # Emit zoom level changed too if we crossed a resolution threshold
         if old_resolution_tier != new_resolution_tier:
-            self.zoom_level_changed.emit(new_zoom)
+            self._zoom_tier_pending = True
+
+        self._queue_emit()
+
+    def _queue_emit(self) -> None:
+        """Schedule a single viewport_changed (and zoom_level_changed) emission"""
+        self._emit_pending = True
+        self._emit_timer.start()
+
+    def _flush_emit(self) -> None:
+        """Emit viewport_changed, then zoom_level_changed, if changes are pending"""
+        if self._emit_pending:
+            self._emit_pending = False
+            self.viewport_changed.emit()
+        if self._zoom_tier_pending:
+            self._zoom_tier_pending = False
+            self.zoom_level_changed.emit(self._zoom_level)
 
     def _get_resolution_tier(self, zoom: float) -> int:
         """Get resolution tier for a given zoom level
@@ -108,14 +139,8 @@ class ViewportState(QObject):
         Returns:
             Resolution tier (0-3)
         """
-        if zoom < 2.0:
-            return 0  # 1000 samples
-        elif zoom < 5.0:
-            return 1  # 2000 samples
-        elif zoom < 10.0:
-            return 2  # 5000 samples
-        else:
-            return 3  # 10000 samples
+        # <2.0 -> 0, <5.0 -> 1, <10.0 -> 2, else 3
+        return bisect.bisect_right(_ZOOM_TIER_THRESHOLDS, zoom)
 
     def get_recommended_resolution(self) -> int:
         """Get recommended waveform resolution for current zoom level
@@ -134,8 +159,7 @@ class ViewportState(QObject):
         # hop_length=512:  ~156 bins, waveform = 156*13 = 2028
         # hop_length=256:  ~312 bins, waveform = 312*16 = 4992
         # hop_length=128:  ~624 bins, waveform = 624*16 = 9984
-        resolutions = [1014, 2028, 4992, 9984]
-        return resolutions[tier]
+        return WAVEFORM_RESOLUTIONS[tier]
 
     def get_recommended_hop_length(self) -> int:
         """Get recommended STFT hop length for current zoom level
@@ -158,13 +182,13 @@ class ViewportState(QObject):
         """
         # Clamp to valid range (can't pan beyond edges)
         max_offset = max(0.0, 1.0 - self.visible_duration)
-        new_offset = np.clip(offset, 0.0, max_offset)
+        new_offset = max(0.0, min(max_offset, offset))
 
         if new_offset == self._pan_offset:
             return  # No change
 
         self._pan_offset = new_offset
-        self.viewport_changed.emit()
+        self._queue_emit()
 
     def reset(self) -> None:
         """Reset to fit-all view (zoom=1.0, pan=0.0)"""
@@ -173,7 +197,7 @@ class ViewportState(QObject):
 
         self._zoom_level = 1.0
         self._pan_offset = 0.0
-        self.viewport_changed.emit()
+        self._queue_emit()
 
     def get_visible_time_range(self) -> tuple[float, float]:
         """Get the exact visible time range as normalized coordinates
@@ -204,7 +228,7 @@ class ViewportState(QObject):
         # Map viewport fraction to normalized time
         normalized_time = self._pan_offset + viewport_fraction * self.visible_duration
 
-        return np.clip(normalized_time, 0.0, 1.0)
+        return max(0.0, min(1.0, normalized_time))
 
     def time_to_screen(self, normalized_time: float, widget_width: float) -> float:
         """Convert normalized time to screen coordinate
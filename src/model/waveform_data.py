@@ -1,12 +1,30 @@
-import pickle
+import errno
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 
 import numpy as np
 
 from src.utils.ffmpeg_wrapper import FFmpegWrapper
 
 
+# Cache files are raw .npy arrays named "<stem>.<resolution>.wfcache.npy"
+CACHE_SUFFIX = ".wfcache.npy"
+
+# Older versions pickled one "<stem>.wfcache" per file; never read, only cleaned up
+_LEGACY_CACHE_SUFFIX = ".wfcache"
+
+# In-process LRU of decoded waveforms keyed by (path, mtime_ns, resolution)
+_WAVEFORM_LRU: "OrderedDict[Tuple[str, int, int], np.ndarray]" = OrderedDict()
+_WAVEFORM_LRU_SIZE = 32
+_WAVEFORM_LRU_LOCK = threading.Lock()
+
+# Size cap per .waveform_cache directory; oldest files are evicted first
+_DISK_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+
 class WaveformData:
     """Extracts and caches waveform data for visualization"""
 
@@ -19,39 +37,220 @@ class WaveformData:
         self.audio_file = Path(audio_file)
         self._ffmpeg = FFmpegWrapper()
         self._waveform: Optional[np.ndarray] = None
+        self._peak_cache: Optional[Tuple[float, float]] = None  # (min, max)
         self._resolution = 1000
+        self._pyramid: Dict[int, np.ndarray] = {}  # resolution -> waveform
+
+        # Cache locations are fixed for the instance's lifetime; the source
+        # mtime is re-read per lookup since the file can be rewritten in place
+        self._cache_dir = self.audio_file.parent / ".waveform_cache"
+        self._cache_paths: Dict[int, Path] = {}
+        self._audio_mtime_ns = -1
+        self._refresh_audio_mtime()
+
+    def _refresh_audio_mtime(self) -> bool:
+        """Re-read the audio file's mtime, dropping tiers built from an older file
+
+        Returns:
+            True if the audio file exists
+        """
+        try:
+            mtime_ns = self.audio_file.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+
+        if mtime_ns != self._audio_mtime_ns:
+            self._audio_mtime_ns = mtime_ns
+            self._pyramid = {}
+        return mtime_ns != -1
 
-    def extract_waveform(self, resolution: int = 1024) -> Optional[np.ndarray]:
+    def extract_waveform(
+        self, resolution: int = 1024, samples: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
         """Extract waveform amplitude data from audio file
 
         Args:
             resolution: Number of sample points (default: 1000)
+            samples: Already-decoded mono samples to reduce instead of
+                running FFmpeg (optional, left unmodified)
 
         Returns:
             Numpy array of amplitude values or None if failed
         """
-        if not self.audio_file.exists():
+        if not self._refresh_audio_mtime():
             return None
 
+        # Serve pre-built resolution tiers without decoding
+        if resolution in self._pyramid:
+            self._resolution = resolution
+            self._set_waveform(self._pyramid[resolution])
+            return self._waveform
+
         self._resolution = resolution
 
-        # Try to load from cache first
+        # Serve repeated requests (e.g. zoom tier toggles) from memory
+        lru_key = (str(self.audio_file), self._audio_mtime_ns, resolution)
+        with _WAVEFORM_LRU_LOCK:
+            cached = _WAVEFORM_LRU.get(lru_key)
+            if cached is not None:
+                _WAVEFORM_LRU.move_to_end(lru_key)
+        if cached is not None:
+            self._set_waveform(cached)
+            return self._waveform
+
+        # Try to load from disk cache next (resolution is encoded in the cache filename)
         cached = self.load_from_cache()
         if cached is not None and len(cached) == resolution:
-            self._waveform = cached
+            # Copy out of the memory map: the LRU outlives this call, and an
+            # open mapping would keep the .npy locked on Windows
+            waveform = np.array(cached)
+            del cached
+            self._set_waveform(waveform)
+            self._remember(lru_key, waveform)
             return self._waveform
 
-        # Extract using FFmpeg
-        waveform = self._ffmpeg.extract_waveform_data(
-            self.audio_file, resolution=resolution
-        )
+        # Reduce shared samples if the caller decoded them, else run FFmpeg
+        if samples is not None:
+            waveform = self.envelope_from_samples(samples, resolution)
+        else:
+            waveform = self._ffmpeg.extract_waveform_data(
+                self.audio_file, resolution=resolution
+            )
 
         if waveform is not None:
-            self._waveform = waveform
+            self._set_waveform(waveform)
             self.cache_waveform()
+            self._remember(lru_key, waveform)
 
         return waveform
 
+    def build_pyramid(
+        self, resolutions: Sequence[int], samples: Optional[np.ndarray] = None
+    ) -> bool:
+        """Extract the finest resolution once and derive coarser tiers from it
+
+        Later extract_waveform() calls for any of these resolutions are
+        served from memory instead of re-decoding the audio file.
+
+        Args:
+            resolutions: Resolutions to prepare (e.g. one per zoom tier)
+            samples: Already-decoded mono samples (optional, see extract_waveform)
+
+        Returns:
+            True if the pyramid was built
+        """
+        tiers = sorted(set(resolutions), reverse=True)
+        if not tiers:
+            return False
+
+        base = self.extract_waveform(tiers[0], samples=samples)
+        if base is None:
+            return False
+
+        pyramid = {tiers[0]: base}
+        for resolution in tiers[1:]:
+            pyramid[resolution] = self.downsample(base, resolution)
+        self._pyramid = pyramid
+        return True
+
+    def is_cached(self, resolution: int) -> bool:
+        """Check whether a resolution can be served without decoding audio
+
+        Args:
+            resolution: Waveform resolution
+
+        Returns:
+            True if the waveform is in memory or has a fresh disk cache
+        """
+        if not self._refresh_audio_mtime():
+            return False
+
+        if resolution in self._pyramid:
+            return True
+
+        lru_key = (str(self.audio_file), self._audio_mtime_ns, resolution)
+        with _WAVEFORM_LRU_LOCK:
+            if lru_key in _WAVEFORM_LRU:
+                return True
+
+        try:
+            cache_mtime_ns = self._get_cache_path(resolution).stat().st_mtime_ns
+        except OSError:
+            return False
+        return cache_mtime_ns >= self._audio_mtime_ns
+
+    @staticmethod
+    def envelope_from_samples(samples: np.ndarray, resolution: int) -> np.ndarray:
+        """Compute the peak amplitude envelope of decoded samples
+
+        Matches FFmpegWrapper.extract_waveform_data, but never writes to
+        samples so the buffer can be shared (e.g. with the spectrogram).
+
+        Args:
+            samples: 1D array of mono samples
+            resolution: Number of points
+
+        Returns:
+            Max absolute value per evenly spaced segment
+        """
+        if len(samples) <= resolution:
+            return np.abs(samples)
+
+        # max|x| per segment is max(max(x), -min(x)); two reductions avoid
+        # allocating a rectified copy of the whole buffer
+        starts = np.linspace(0, len(samples), resolution + 1, dtype=int)[:-1]
+        peaks = np.maximum.reduceat(samples, starts)
+        troughs = np.minimum.reduceat(samples, starts)
+        return np.maximum(peaks, np.negative(troughs, out=troughs), out=peaks)
+
+    @staticmethod
+    def downsample(waveform: np.ndarray, resolution: int) -> np.ndarray:
+        """Reduce a waveform to a coarser resolution using block maxima
+
+        Args:
+            waveform: Amplitude array
+            resolution: Target number of points
+
+        Returns:
+            Downsampled waveform (unchanged if already small enough)
+        """
+        if len(waveform) <= resolution:
+            return waveform
+
+        # Evenly spaced block starts keep every point an equal time interval;
+        # reduceat handles lengths that aren't a multiple of the resolution
+        starts = (np.arange(resolution) * len(waveform)) // resolution
+
+        # Reduce the plain ndarray (not a cache memmap) straight into the output
+        source = np.asarray(waveform)
+        out = np.empty(resolution, dtype=source.dtype)
+        return np.maximum.reduceat(source, starts, out=out)
+
+    def _set_waveform(self, waveform: np.ndarray) -> None:
+        """Make a waveform current and record its peak levels
+
+        Args:
+            waveform: Waveform array
+        """
+        self._waveform = waveform
+        self._peak_cache = (
+            (float(waveform.min()), float(waveform.max())) if len(waveform) else None
+        )
+
+    @staticmethod
+    def _remember(key: Tuple[str, int, int], waveform: np.ndarray) -> None:
+        """Insert a waveform into the in-process LRU, evicting the oldest
+
+        Args:
+            key: (path, mtime_ns, resolution) tuple
+            waveform: Waveform array
+        """
+        with _WAVEFORM_LRU_LOCK:
+            _WAVEFORM_LRU[key] = waveform
+            _WAVEFORM_LRU.move_to_end(key)
+            while len(_WAVEFORM_LRU) > _WAVEFORM_LRU_SIZE:
+                _WAVEFORM_LRU.popitem(last=False)
+
     def get_peak_levels(self) -> Tuple[float, float]:
         """Get minimum and maximum amplitude levels
 
@@ -61,10 +260,11 @@ class WaveformData:
         if self._waveform is None:
             self.extract_waveform()
 
-        if self._waveform is None or len(self._waveform) == 0:
+        # Peaks are recorded whenever the current waveform changes
+        if self._peak_cache is None:
             return (0.0, 0.0)
 
-        return (float(np.min(self._waveform)), float(np.max(self._waveform)))
+        return self._peak_cache
 
     def cache_waveform(self) -> bool:
         """Cache waveform data to file
@@ -79,10 +279,8 @@ class WaveformData:
             cache_path = self._get_cache_path()
             cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(cache_path, "wb") as f:
-                pickle.dump(
-                    {"waveform": self._waveform, "resolution": self._resolution}, f
-                )
+            np.save(cache_path, np.asarray(self._waveform))
+            self.prune_cache_dir(self._cache_dir)
 
             return True
 
@@ -91,7 +289,10 @@ class WaveformData:
             return False
 
     def load_from_cache(self) -> Optional[np.ndarray]:
-        """Load waveform data from cache
+        """Load waveform data for the current resolution from cache
+
+        The array is memory-mapped read-only, so only the pages that are
+        actually read get loaded.
 
         Returns:
             Cached waveform array or None if not found
@@ -103,38 +304,49 @@ class WaveformData:
                 return None
 
             # Check if cache is newer than audio file
-            if cache_path.stat().st_mtime < self.audio_file.stat().st_mtime:
+            if cache_path.stat().st_mtime_ns < self._audio_mtime_ns:
                 # Audio file was modified after cache, invalidate cache
                 return None
 
-            with open(cache_path, "rb") as f:
-                data = pickle.load(f)
-                return data.get("waveform")
+            return np.load(cache_path, mmap_mode="r")
 
         except Exception as e:
             print(f"Warning: Failed to load cached waveform: {e}")
             return None
 
-    def _get_cache_path(self) -> Path:
+    def _get_cache_path(self, resolution: Optional[int] = None) -> Path:
         """Get path to cache file
 
+        Args:
+            resolution: Waveform resolution (default: current resolution)
+
         Returns:
             Path to cache file
         """
-        cache_dir = self.audio_file.parent / ".waveform_cache"
-        cache_file = f"{self.audio_file.stem}.wfcache"
-        return cache_dir / cache_file
+        if resolution is None:
+            resolution = self._resolution
+
+        cache_path = self._cache_paths.get(resolution)
+        if cache_path is None:
+            cache_file = f"{self.audio_file.stem}.{resolution}{CACHE_SUFFIX}"
+            cache_path = self._cache_dir / cache_file
+            self._cache_paths[resolution] = cache_path
+        return cache_path
 
     def clear_cache(self) -> bool:
-        """Delete cached waveform data
+        """Delete cached waveform data for all resolutions
 
         Returns:
             True if deleted successfully
         """
         try:
-            cache_path = self._get_cache_path()
-            if cache_path.exists():
-                cache_path.unlink()
+            prefix = f"{self.audio_file.stem}."
+            for cache_path in self._cache_dir.glob(f"{prefix}*{CACHE_SUFFIX}"):
+                resolution = cache_path.name[len(prefix) : -len(CACHE_SUFFIX)]
+                if resolution.isdigit():
+                    cache_path.unlink()
+            legacy_name = f"{self.audio_file.stem}{_LEGACY_CACHE_SUFFIX}"
+            (self._cache_dir / legacy_name).unlink(missing_ok=True)
             return True
         except Exception as e:
             print(f"Warning: Failed to clear cache: {e}")
@@ -148,11 +360,14 @@ class WaveformData:
         """
         return self._waveform
 
-    def normalize_waveform(self, target_max: float = 1.0) -> Optional[np.ndarray]:
+    def normalize_waveform(
+        self, target_max: float = 1.0, out: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
         """Normalize waveform to target maximum amplitude
 
         Args:
             target_max: Target maximum amplitude (default: 1.0)
+            out: Optional array to write into, so callers can reuse a buffer
 
         Returns:
             Normalized waveform array or None
@@ -163,12 +378,15 @@ class WaveformData:
         if self._waveform is None or len(self._waveform) == 0:
             return None
 
-        current_max = np.max(self._waveform)
+        current_max = float(self._waveform.max())
         if current_max == 0:
             return self._waveform
 
-        normalized = (self._waveform / current_max) * target_max
-        return normalized
+        # Single scaling pass into one output array
+        if out is None:
+            out = np.empty(self._waveform.shape, dtype=self._waveform.dtype)
+        np.multiply(self._waveform, target_max / current_max, out=out)
+        return out
 
     @staticmethod
     def extract_from_file(
@@ -186,6 +404,53 @@ class WaveformData:
         extractor = WaveformData(file_path)
         return extractor.extract_waveform(resolution)
 
+    @staticmethod
+    def prune_cache_dir(
+        cache_dir: Path, max_bytes: int = _DISK_CACHE_MAX_BYTES
+    ) -> int:
+        """Evict the oldest cache files until the directory fits the size cap
+
+        Legacy pickle caches are deleted outright.
+
+        Args:
+            cache_dir: Waveform cache directory
+            max_bytes: Maximum total size of cache files in bytes
+
+        Returns:
+            Number of cache files deleted
+        """
+        entries = []
+        total = 0
+        count = 0
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.name.endswith(_LEGACY_CACHE_SUFFIX):
+                    try:
+                        os.unlink(entry.path)
+                        count += 1
+                    except FileNotFoundError:
+                        pass
+                elif entry.name.endswith(CACHE_SUFFIX):
+                    stat = entry.stat(follow_symlinks=False)
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        if total <= max_bytes:
+            return count
+
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            count += 1
+        return count
+
     @staticmethod
     def clear_all_caches(directory: Path) -> int:
         """Clear all waveform caches in a directory
@@ -201,13 +466,21 @@ class WaveformData:
 
         if cache_dir.exists():
             try:
-                for cache_file in cache_dir.glob("*.wfcache"):
-                    cache_file.unlink()
-                    count += 1
+                # DirEntry names avoid building a Path per file
+                with os.scandir(cache_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(
+                            (CACHE_SUFFIX, _LEGACY_CACHE_SUFFIX)
+                        ) and entry.is_file(follow_symlinks=False):
+                            os.unlink(entry.path)
+                            count += 1
 
                 # Remove cache directory if empty
-                if not any(cache_dir.iterdir()):
-                    cache_dir.rmdir()
+                try:
+                    os.rmdir(cache_dir)
+                except OSError as e:
+                    if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                        raise
 
             except Exception as e:
                 print(f"Warning: Failed to clear caches: {e}")
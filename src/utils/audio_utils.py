@@ -1,10 +1,221 @@
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
 import numpy as np
+from scipy import fft as sp_fft
 from scipy import signal
 
+# File extensions accepted as audio by AudioUtils.validate_audio_file
+_VALID_AUDIO_EXTS = frozenset(
+    {
+        ".wav",
+        ".mp3",
+        ".m4a",
+        ".aac",
+        ".opus",
+        ".ogg",
+        ".flac",
+        ".wma",
+        ".oga",
+        ".spx",
+    }
+)
+
+# Units used by AudioUtils.format_file_size, one per power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+# "MM:SS" for every second of an hour, indexed by seconds
+_MMSS_TABLE = tuple(f"{m:02d}:{s:02d}" for m in range(60) for s in range(60))
+
+
+def _format_whole_seconds(total_seconds: int) -> str:
+    """Format a non-negative whole number of seconds as MM:SS or HH:MM:SS"""
+    if total_seconds < 3600:
+        return _MMSS_TABLE[total_seconds]
+
+    hours, remainder = divmod(total_seconds, 3600)
+    return f"{hours:02d}:{_MMSS_TABLE[remainder]}"
+
+
+@lru_cache(maxsize=4096)
+def _format_byte_count(size_bytes: int) -> str:
+    """Format a non-negative byte count (cached per value)"""
+    # Each unit is a power of 1024, so the unit follows from the bit length
+    unit_index = min(len(_SIZE_UNITS) - 1, max(0, (size_bytes.bit_length() - 1) // 10))
+
+    if unit_index == 0:  # Bytes
+        return f"{size_bytes} {_SIZE_UNITS[0]}"
+    size = size_bytes / (1 << (10 * unit_index))
+    return f"{size:.1f} {_SIZE_UNITS[unit_index]}"
+
+
+@lru_cache(maxsize=8)
+def _get_window(window: str, n_fft: int) -> np.ndarray:
+    """Get a cached, read-only float32 STFT window array"""
+    values = signal.get_window(window, n_fft).astype(np.float32)
+    values.setflags(write=False)
+    return values
+
+
+@lru_cache(maxsize=8)
+def _rfftfreqs(n_fft: int, sample_rate: int) -> np.ndarray:
+    """Get cached, read-only rfft bin frequencies in Hz"""
+    freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+    freqs.setflags(write=False)
+    return freqs
+
+
+@lru_cache(maxsize=8)
+def _frequency_bounds(
+    n_fft: int, sample_rate: int, freq_min: float, freq_max: float
+) -> Tuple[int, int]:
+    """Get cached [lo, hi) rfft bin bounds covering [freq_min, freq_max]"""
+    freqs = _rfftfreqs(n_fft, sample_rate)
+    lo = int(np.searchsorted(freqs, freq_min, side="left"))
+    hi = int(np.searchsorted(freqs, freq_max, side="right"))
+    return lo, hi
+
+
+class StftEngine:
+    """Shared STFT engine for offline spectrograms and live recording
+
+    Holds the window, frequency-range bounds and scratch buffers for one
+    configuration. run() transforms a whole signal in a single batched FFT;
+    slice() produces a live slice from the latest recorded samples.
+    """
+
+    def __init__(
+        self,
+        n_fft: int = 1024,
+        hop_length: Optional[int] = None,
+        sample_rate: int = 48000,
+        window: str = "hann",
+        freq_min: float = 0.0,
+        freq_max: float = float("inf"),
+    ):
+        """Initialize engine state
+
+        Args:
+            n_fft: FFT window size (number of samples)
+            hop_length: Samples between successive frames (default: n_fft)
+            sample_rate: Sampling frequency in Hz
+            window: Window function to apply (default: 'hann')
+            freq_min: Minimum frequency to keep (Hz)
+            freq_max: Maximum frequency to keep (Hz)
+        """
+        self.n_fft = n_fft
+        self.hop_length = hop_length or n_fft
+        self.sample_rate = sample_rate
+        self.window = _get_window(window, n_fft)
+        self._lo, self._hi = _frequency_bounds(n_fft, sample_rate, freq_min, freq_max)
+
+        # Scratch buffers for live slices
+        self._windowed = np.empty(n_fft, dtype=np.float32)
+        self._mag_buf = np.empty(n_fft // 2 + 1, dtype=np.float32)
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """Frequency values in Hz of the bins this engine returns"""
+        return _rfftfreqs(self.n_fft, self.sample_rate)[self._lo : self._hi]
+
+    @staticmethod
+    def _to_db(magnitude: np.ndarray) -> None:
+        """Convert magnitudes to dB in place, clipping to a small floor"""
+        np.maximum(magnitude, np.float32(1e-10), out=magnitude)
+        np.log10(magnitude, out=magnitude)
+        magnitude *= np.float32(20.0)
+
+    def run(self, audio_data: np.ndarray) -> np.ndarray:
+        """Compute the spectrogram of a whole signal
+
+        Args:
+            audio_data: 1D numpy array of audio samples
+
+        Returns:
+            2D float32 array [time, freq] with dB values
+        """
+        n_fft, hop_length = self.n_fft, self.hop_length
+
+        # Spectrogram display needs far less precision than float64
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        num_samples = len(audio_data)
+
+        # Zero-pad the tail so the last frame is complete (matches
+        # scipy.signal.stft with boundary=None, padded=True)
+        if num_samples <= n_fft:
+            num_frames = 1
+        else:
+            num_frames = 1 + -(-(num_samples - n_fft) // hop_length)
+        padded_length = (num_frames - 1) * hop_length + n_fft
+        if padded_length > num_samples:
+            audio_data = np.pad(audio_data, (0, padded_length - num_samples))
+
+        # CRITICAL FIX: Remove any STFT frames that extend beyond the actual audio duration
+        # Frame times are window centers, so the last frame's window can extend
+        # past the end of the audio, causing misalignment with playback position
+        max_start = num_samples - n_fft / 2
+        num_valid = int(max_start // hop_length) + 1 if max_start >= 0 else 0
+        num_frames = max(1, min(num_frames, num_valid))
+
+        # Strided [frames, n_fft] view of the signal - no per-frame copies -
+        # so the FFT runs as a single batched call over all frames
+        frames = np.lib.stride_tricks.sliding_window_view(audio_data, n_fft)[
+            : (num_frames - 1) * hop_length + 1 : hop_length
+        ]
+
+        # scipy.fft keeps float32 input in complex64 and reuses cached plans
+        Zxx = sp_fft.rfft(frames * self.window, n=n_fft, axis=-1)
+
+        # Convert to float32 magnitude (dB scale) reusing one output buffer
+        # Already [time_frames, freq_bins] for easier visualization
+        spectrogram = np.empty(Zxx.shape, dtype=np.float32)
+        np.abs(Zxx, out=spectrogram)
+
+        # Same amplitude scaling as scipy.signal.stft (scaling="spectrum")
+        spectrogram *= np.float32(1.0 / self.window.sum())
+        self._to_db(spectrogram)
+
+        return spectrogram[:, self._lo : self._hi]
+
+    def slice(self, audio_chunk: np.ndarray) -> Optional[np.ndarray]:
+        """Compute the dB magnitude slice for the last n_fft samples
+
+        Args:
+            audio_chunk: 1D numpy array of audio samples
+
+        Returns:
+            1D float32 view of dB magnitudes for the frequency range (only
+            valid until the next call), or None if chunk is too small
+        """
+        if len(audio_chunk) < self.n_fft:
+            return None
+
+        # Window the last n_fft samples straight into the scratch buffer
+        np.multiply(audio_chunk[-self.n_fft :], self.window, out=self._windowed)
+
+        # Live slices stay unscaled, as the recording display always has been
+        magnitude = self._mag_buf
+        np.abs(sp_fft.rfft(self._windowed), out=magnitude)
+        self._to_db(magnitude)
+
+        return magnitude[self._lo : self._hi]
+
+
+@lru_cache(maxsize=8)
+def _get_engine(
+    n_fft: int,
+    hop_length: int,
+    sample_rate: int,
+    window: str = "hann",
+    freq_min: float = 0.0,
+    freq_max: float = float("inf"),
+) -> StftEngine:
+    """Get a shared StftEngine for one configuration"""
+    return StftEngine(n_fft, hop_length, sample_rate, window, freq_min, freq_max)
+
 
 class AudioUtils:
     """Helper functions for audio processing and formatting"""
@@ -22,13 +233,8 @@ class AudioUtils:
         if seconds < 0:
             return "00:00"
 
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        return f"{minutes:02d}:{secs:02d}"
+        # Under an hour this is a table lookup, no string formatting
+        return _format_whole_seconds(int(seconds))
 
     @staticmethod
     def format_file_size(size_bytes: int) -> str:
@@ -43,17 +249,7 @@ class AudioUtils:
         if size_bytes < 0:
             return "0 B"
 
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(size_bytes)
-        unit_index = 0
-
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-
-        if unit_index == 0:  # Bytes
-            return f"{int(size)} {units[unit_index]}"
-        return f"{size:.1f} {units[unit_index]}"
+        return _format_byte_count(int(size_bytes))
 
     @staticmethod
     def calculate_file_size(duration: float, bit_rate: Optional[int]) -> int:
@@ -100,23 +296,10 @@ class AudioUtils:
         Returns:
             True if file exists and has valid audio extension
         """
-        if not file_path.exists() or not file_path.is_file():
-            return False
-
-        valid_extensions = {
-            ".wav",
-            ".mp3",
-            ".m4a",
-            ".aac",
-            ".opus",
-            ".ogg",
-            ".flac",
-            ".wma",
-            ".oga",
-            ".spx",
-        }
-
-        return file_path.suffix.lower() in valid_extensions
+        # Cheap suffix check first; is_file() implies existence (one stat call)
+        return (
+            file_path.suffix.lower() in _VALID_AUDIO_EXTS and file_path.is_file()
+        )
 
     @staticmethod
     def parse_duration_string(duration_str: str) -> float:
@@ -159,39 +342,11 @@ class AudioUtils:
 
         Returns:
             Tuple of (magnitude_spectrogram, frequencies)
-            - magnitude_spectrogram: 2D array [time, freq] with dB values
+            - magnitude_spectrogram: 2D float32 array [time, freq] with dB values
             - frequencies: 1D array of frequency values in Hz
         """
-        # Compute STFT without boundary padding to avoid time offset
-        f, t, Zxx = signal.stft(
-            audio_data,
-            fs=sample_rate,
-            window=window,
-            nperseg=n_fft,
-            noverlap=n_fft - hop_length,
-            boundary=None,  # Avoid zero-padding that causes time misalignment
-        )
-
-        # Convert to magnitude (dB scale)
-        magnitude = np.abs(Zxx)
-
-        # Avoid log(0) by adding small epsilon
-        magnitude_db = 20 * np.log10(magnitude + 1e-10)
-
-        # Transpose to [time, freq] format for easier visualization
-        spectrogram = magnitude_db.T  # Shape: [time_frames, freq_bins]
-
-        # CRITICAL FIX: Remove any STFT frames that extend beyond the actual audio duration
-        # This happens because STFT uses window centers, so the last frame's window
-        # can extend past the end of the audio, causing misalignment with playback position
-        audio_duration = len(audio_data) / sample_rate
-        stft_duration = t[-1] if len(t) > 0 else 0.0
-        if len(t) > 0 and stft_duration > audio_duration:
-            # Find frames that are within the audio duration
-            valid_frames = t <= audio_duration
-            spectrogram = spectrogram[valid_frames, :]
-
-        return spectrogram, f
+        engine = _get_engine(n_fft, hop_length, sample_rate, window)
+        return engine.run(audio_data), engine.frequencies
 
     @staticmethod
     def filter_frequency_range(
@@ -213,8 +368,10 @@ class AudioUtils:
         Returns:
             Tuple of (filtered_spectrogram, filtered_frequencies)
         """
-        mask = (frequencies >= freq_min) & (frequencies <= freq_max)
-        return spectrogram[:, mask], frequencies[mask]
+        # Frequencies are ascending, so the range is a contiguous slice (a view)
+        lo = int(np.searchsorted(frequencies, freq_min, side="left"))
+        hi = int(np.searchsorted(frequencies, freq_max, side="right"))
+        return spectrogram[:, lo:hi], frequencies[lo:hi]
 
     @staticmethod
     def compute_stft_slice(
@@ -238,31 +395,13 @@ class AudioUtils:
             freq_max: Maximum frequency to keep (Hz)
 
         Returns:
-            1D array of magnitude values for the frequency range,
+            1D float32 array of dB magnitudes for the frequency range,
             or None if chunk is too small
         """
-        # Need at least n_fft samples
-        if len(audio_chunk) < n_fft:
+        # Reuse the per-configuration scratch buffers, but hand back a copy
+        # since callers keep slices around (e.g. the recording buffer)
+        engine = _get_engine(n_fft, n_fft, sample_rate, "hann", freq_min, freq_max)
+        magnitude_db = engine.slice(audio_chunk)
+        if magnitude_db is None:
             return None
-
-        # Use only the last n_fft samples for this slice
-        audio_window = audio_chunk[-n_fft:]
-
-        # Apply Hann window
-        window = signal.get_window("hann", n_fft)
-        windowed = audio_window * window
-
-        # Compute FFT
-        fft_result = np.fft.rfft(windowed, n=n_fft)
-
-        # Get magnitude and convert to dB
-        magnitude = np.abs(fft_result)
-        magnitude_db = 20 * np.log10(magnitude + 1e-10)
-
-        # Get frequency bins
-        frequencies = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
-
-        # Filter to voice range
-        mask = (frequencies >= freq_min) & (frequencies <= freq_max)
-
-        return magnitude_db[mask]
+        return magnitude_db.copy()
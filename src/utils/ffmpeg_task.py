@@ -0,0 +1,46 @@
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class FFmpegTaskSignals(QObject):
+    """Signals for FFmpegTask (QRunnable itself can't emit signals)"""
+
+    finished = Signal(object)  # Return value of the wrapped call
+    failed = Signal(str)  # Error message
+
+
+class FFmpegTask(QRunnable):
+    """Runs a blocking FFmpegWrapper call on a thread pool
+
+    Results are delivered through ``signals``, which lives in the thread
+    that created the task, so connected slots run on the GUI thread.
+    Keep a reference to the task until it has finished.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any):
+        """Initialize task
+
+        Args:
+            fn: Blocking callable to run (e.g. a bound FFmpegWrapper method)
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        super().__init__()
+        self.signals = FFmpegTaskSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self) -> None:
+        """Execute the call in the pool thread"""
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+    def start(self) -> None:
+        """Queue the task on the global thread pool"""
+        QThreadPool.globalInstance().start(self)
@@ -1,11 +1,175 @@
 import json
+import os
+import re
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+from src.utils.platform_utils import HIDDEN_PROCESS_KWARGS
+
+
+# Reduced analysis window for ffprobe (microseconds / bytes)
+_FAST_PROBE_ARGS = ("-analyzeduration", "100000", "-probesize", "500000")
+
+# Waveform decoding: samples decoded per output point, and the lowest
+# decode rate used (keeps content up to 4 kHz)
+_WAVEFORM_SAMPLES_PER_POINT = 32
+_WAVEFORM_MIN_SAMPLE_RATE = 8000
+
+
+@lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> Optional[str]:
+    """Resolve an executable name to its absolute path (cached per process)"""
+    return shutil.which(name)
+
+
+# Keep ffmpeg's stderr to actual errors: no banner, no per-second progress
+# stats. PCM readers discard stderr; conversions report it on failure.
+_QUIET_ARGS = ("-hide_banner", "-nostats", "-loglevel", "error")
+
+# Encoder name column of `ffmpeg -encoders` (lines look like " A..... aac  AAC ...")
+_ENCODER_RE = re.compile(r"^[ \t]+\S+[ \t]+(\S+)", re.MULTILINE)
+
+
+@lru_cache(maxsize=None)
+def _list_encoders(ffmpeg_path: str) -> Tuple[str, ...]:
+    """Get encoder names reported by an ffmpeg executable (cached per path)
+
+    Failures raise, so lru_cache only keeps successful runs.
+
+    Raises:
+        subprocess.SubprocessError: If ffmpeg failed or timed out
+        FileNotFoundError: If ffmpeg is not installed
+    """
+    result = subprocess.run(
+        [ffmpeg_path, "-encoders"],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=5,
+        **HIDDEN_PROCESS_KWARGS,
+    )
+    return tuple(_ENCODER_RE.findall(result.stdout))
+
+
+def _run_ffprobe(
+    ffprobe_path: str, file_path: str, extra_args: Sequence[str]
+) -> Optional[Dict[str, any]]:
+    """Run ffprobe on a file and return its parsed JSON output
+
+    Args:
+        ffprobe_path: Path to ffprobe executable
+        file_path: Path to audio file
+        extra_args: Options inserted before the input file
+
+    Returns:
+        Parsed ffprobe output or None if probing failed
+    """
+    try:
+        result = subprocess.run(
+            [
+                ffprobe_path,
+                "-v",
+                "quiet",
+                *extra_args,
+                "-print_format",
+                "json",
+                "-show_format",
+                "-show_streams",
+                file_path,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10,
+            **HIDDEN_PROCESS_KWARGS,
+        )
+        return json.loads(result.stdout)
+    except (subprocess.SubprocessError, json.JSONDecodeError):
+        return None
+
+
+# Returned by get_audio_info when a file can't be probed
+_UNKNOWN_AUDIO_INFO = {
+    "codec": "unknown",
+    "sample_rate": 0,
+    "bit_rate": None,
+    "duration": 0.0,
+    "channels": 0,
+    "format": "unknown",
+}
+
+
+class _ProbeFailed(Exception):
+    """ffprobe failed or timed out; raised so lru_cache doesn't keep the result"""
+
+
+@lru_cache(maxsize=4096)
+def _probe_audio_info(
+    ffprobe_path: str, file_path: str, mtime_ns: int, size: int
+) -> Dict[str, any]:
+    """Run ffprobe once per (path, mtime, size) and parse its audio metadata
+
+    Callers get a copy via FFmpegWrapper.get_audio_info, since the cached
+    dict is shared. Failures raise instead of returning placeholder info,
+    so a transient error is retried on the next call.
+
+    Raises:
+        _ProbeFailed: If ffprobe failed, timed out or gave unparsable output
+        FileNotFoundError: If ffprobe is not installed
+    """
+    info = dict(_UNKNOWN_AUDIO_INFO)
+
+    # Short memos don't need ffprobe's default 5 s / 5 MB analysis window;
+    # fall back to the defaults if the quick probe finds no audio stream
+    data = _run_ffprobe(ffprobe_path, file_path, _FAST_PROBE_ARGS)
+    if data is None or not any(
+        stream.get("codec_type") == "audio" for stream in data.get("streams", ())
+    ):
+        data = _run_ffprobe(ffprobe_path, file_path, ())
+    if data is None:
+        raise _ProbeFailed(file_path)
+
+    # Get format info
+    if "format" in data:
+        info["format"] = data["format"].get("format_name", "unknown")
+        info["duration"] = float(data["format"].get("duration", 0.0))
+        if "bit_rate" in data["format"]:
+            info["bit_rate"] = int(data["format"]["bit_rate"])
+
+    # Get first audio stream info
+    if "streams" in data:
+        for stream in data["streams"]:
+            if stream.get("codec_type") == "audio":
+                info["codec"] = stream.get("codec_name", "unknown")
+                info["sample_rate"] = int(stream.get("sample_rate", 0))
+                info["channels"] = int(stream.get("channels", 0))
+                if "bit_rate" in stream and info["bit_rate"] is None:
+                    info["bit_rate"] = int(stream["bit_rate"])
+                break
+
+    return info
+
+
+@dataclass
+class ConvertJob:
+    """Arguments for one FFmpegWrapper.convert_format call"""
+
+    input_path: Path
+    output_path: Path
+    codec: str  # FFmpeg encoder name
+    sample_rate: Optional[int] = None
+    bit_rate: Optional[int] = None
+    channels: Optional[int] = None
+    extra_args: Optional[List[str]] = None
+
 
 class FFmpegWrapper:
     """Wrapper for FFmpeg subprocess operations"""
@@ -17,8 +181,10 @@ class FFmpegWrapper:
             ffmpeg_path: Path to ffmpeg executable (default: "ffmpeg" from PATH)
             ffprobe_path: Path to ffprobe executable (default: "ffprobe" from PATH)
         """
-        self.ffmpeg_path = ffmpeg_path
-        self.ffprobe_path = ffprobe_path
+        # Resolve against PATH once; subprocess calls then skip the PATH search
+        self._ffmpeg_resolved = _resolve_executable(ffmpeg_path)
+        self.ffmpeg_path = self._ffmpeg_resolved or ffmpeg_path
+        self.ffprobe_path = _resolve_executable(ffprobe_path) or ffprobe_path
 
     def check_availability(self) -> bool:
         """Check if FFmpeg is available on the system
@@ -26,7 +192,7 @@ class FFmpegWrapper:
         Returns:
             True if FFmpeg is available and executable
         """
-        return shutil.which(self.ffmpeg_path) is not None
+        return self._ffmpeg_resolved is not None
 
     def get_version(self) -> str:
         """Get FFmpeg version string
@@ -41,10 +207,10 @@ class FFmpegWrapper:
                 text=True,
                 check=True,
                 timeout=5,
+                **HIDDEN_PROCESS_KWARGS,
             )
-            # First line contains version info
-            first_line = result.stdout.split("\n")[0]
-            return first_line
+            # First line contains version info; partition stops at the first newline
+            return result.stdout.partition("\n")[0]
         except (subprocess.SubprocessError, FileNotFoundError):
             return "Unknown"
 
@@ -54,28 +220,13 @@ class FFmpegWrapper:
         Returns:
             Dictionary with 'encoders' and 'decoders' keys containing codec lists
         """
-        codecs = {"encoders": [], "decoders": []}
-
+        # The installed ffmpeg doesn't change while the app runs; failed
+        # runs aren't cached, so they are retried on the next call
         try:
-            # Get encoders
-            result = subprocess.run(
-                [self.ffmpeg_path, "-encoders"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=5,
-            )
-            for line in result.stdout.split("\n"):
-                if line.strip() and line.startswith(" "):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        codec_name = parts[1]
-                        codecs["encoders"].append(codec_name)
-
+            encoders = list(_list_encoders(self.ffmpeg_path))
         except (subprocess.SubprocessError, FileNotFoundError):
-            pass
-
-        return codecs
+            encoders = []
+        return {"encoders": encoders, "decoders": []}
 
     def get_audio_info(self, file_path: Path) -> Dict[str, any]:
         """Extract audio metadata from file using ffprobe
@@ -92,57 +243,45 @@ class FFmpegWrapper:
             - channels: Number of audio channels
             - format: Container format
         """
-        info = {
-            "codec": "unknown",
-            "sample_rate": 0,
-            "bit_rate": None,
-            "duration": 0.0,
-            "channels": 0,
-            "format": "unknown",
-        }
-
         try:
-            result = subprocess.run(
-                [
-                    self.ffprobe_path,
-                    "-v",
-                    "quiet",
-                    "-print_format",
-                    "json",
-                    "-show_format",
-                    "-show_streams",
-                    str(file_path),
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10,
+            try:
+                stat = Path(file_path).stat()
+            except OSError:
+                # Nothing stable to key on; probe without caching
+                return _probe_audio_info.__wrapped__(
+                    self.ffprobe_path, str(file_path), -1, -1
+                )
+
+            # Keyed on mtime/size so edited files are re-probed
+            info = _probe_audio_info(
+                self.ffprobe_path, str(file_path), stat.st_mtime_ns, stat.st_size
             )
+        except (_ProbeFailed, FileNotFoundError):
+            # Probe failed or ffprobe not installed; not cached, so retried later
+            return dict(_UNKNOWN_AUDIO_INFO)
+        return dict(info)
 
-            data = json.loads(result.stdout)
-
-            # Get format info
-            if "format" in data:
-                info["format"] = data["format"].get("format_name", "unknown")
-                info["duration"] = float(data["format"].get("duration", 0.0))
-                if "bit_rate" in data["format"]:
-                    info["bit_rate"] = int(data["format"]["bit_rate"])
-
-            # Get first audio stream info
-            if "streams" in data:
-                for stream in data["streams"]:
-                    if stream.get("codec_type") == "audio":
-                        info["codec"] = stream.get("codec_name", "unknown")
-                        info["sample_rate"] = int(stream.get("sample_rate", 0))
-                        info["channels"] = int(stream.get("channels", 0))
-                        if "bit_rate" in stream and info["bit_rate"] is None:
-                            info["bit_rate"] = int(stream["bit_rate"])
-                        break
+    def get_audio_info_batch(
+        self, file_paths: Iterable[Path]
+    ) -> Dict[Path, Dict[str, any]]:
+        """Extract audio metadata for many files at once
+
+        ffprobe processes run concurrently; the threads only wait on
+        subprocesses, so the GIL isn't a bottleneck.
 
-        except (subprocess.SubprocessError, json.JSONDecodeError, FileNotFoundError):
-            pass
+        Args:
+            file_paths: Paths to audio files
+
+        Returns:
+            Dictionary mapping each path to its get_audio_info() result
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) <= 1:
+            return {path: self.get_audio_info(path) for path in file_paths}
 
-        return info
+        max_workers = min(8, os.cpu_count() or 1, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(file_paths, executor.map(self.get_audio_info, file_paths)))
 
     def convert_format(
         self,
@@ -168,7 +307,7 @@ class FFmpegWrapper:
         Returns:
             Tuple of (success: bool, error_message: str)
         """
-        cmd = [self.ffmpeg_path, "-i", str(input_path), "-y"]
+        cmd = [self.ffmpeg_path, *_QUIET_ARGS, "-i", str(input_path), "-y"]
 
         # Audio codec
         cmd.extend(["-c:a", codec])
@@ -192,22 +331,79 @@ class FFmpegWrapper:
         # Output file
         cmd.append(str(output_path))
 
+        return self._run_conversion(cmd)
+
+    def _run_conversion(self, cmd: List[str]) -> Tuple[bool, str]:
+        """Run an ffmpeg conversion command that writes to output files
+
+        stdout is discarded and stderr is drained by communicate(), so a
+        chatty encoder can't fill the pipe and stall the process.
+
+        Args:
+            cmd: Complete FFmpeg command
+
+        Returns:
+            Tuple of (success: bool, error_message: str)
+        """
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                check=True,
-                timeout=300,  # 5 minute timeout
+                bufsize=1 << 16,
+                **HIDDEN_PROCESS_KWARGS,
             )
-            return True, ""
-        except subprocess.CalledProcessError as e:
-            return False, e.stderr
-        except subprocess.TimeoutExpired:
-            return False, "Conversion timed out"
         except FileNotFoundError:
             return False, "FFmpeg not found"
 
+        try:
+            _, stderr = process.communicate(timeout=300)  # 5 minute timeout
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            return False, "Conversion timed out"
+
+        if process.returncode != 0:
+            return False, stderr
+        return True, ""
+
+    def convert_format_batch(
+        self, jobs: Sequence[ConvertJob], max_parallel: Optional[int] = None
+    ) -> List[Tuple[bool, str]]:
+        """Run several conversions concurrently
+
+        Each ffmpeg is limited to a couple of threads so parallel jobs
+        don't oversubscribe the CPU.
+
+        Args:
+            jobs: Conversions to run
+            max_parallel: Maximum concurrent ffmpeg processes
+                (default: half the CPU count)
+
+        Returns:
+            List of (success, error_message) tuples in job order
+        """
+        if not jobs:
+            return []
+
+        if max_parallel is None:
+            max_parallel = max(1, (os.cpu_count() or 2) // 2)
+
+        def run(job: ConvertJob) -> Tuple[bool, str]:
+            return self.convert_format(
+                job.input_path,
+                job.output_path,
+                job.codec,
+                sample_rate=job.sample_rate,
+                bit_rate=job.bit_rate,
+                channels=job.channels,
+                extra_args=["-threads", "2", *(job.extra_args or [])],
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_parallel, len(jobs))) as executor:
+            return list(executor.map(run, jobs))
+
     def extract_audio_samples(
         self,
         file_path: Path,
@@ -231,6 +427,7 @@ class FFmpegWrapper:
             # Build ffmpeg command to extract PCM data
             cmd = [
                 self.ffmpeg_path,
+                *_QUIET_ARGS,
                 "-i",
                 str(file_path),
                 "-f",
@@ -246,17 +443,15 @@ class FFmpegWrapper:
 
             cmd.append("-")  # Output to stdout
 
-            # Run ffmpeg
-            result = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False
+            # Stream ffmpeg's output straight into a numpy-backed buffer
+            expected = self._estimate_sample_count(
+                file_path, sample_rate, channels, max_duration
             )
-
-            if result.returncode != 0:
+            try:
+                audio_data = self._read_pcm(cmd, expected)
+            except subprocess.CalledProcessError:
                 return None
 
-            # Convert bytes to numpy array
-            audio_data = np.frombuffer(result.stdout, dtype=np.float32)
-
             # If stereo, reshape to [samples, channels]
             if channels == 2 and len(audio_data) > 0:
                 audio_data = audio_data.reshape(-1, 2)
@@ -291,17 +486,31 @@ class FFmpegWrapper:
             # Use file's sample rate or downsample to 16kHz for efficiency (matches spectrogram)
             target_sample_rate = min(file_sample_rate, 16000)
 
+            # Long memos at low resolution only need enough samples per point
+            # to find its peak, so let ffmpeg decimate further (never below
+            # the voice band). Segments are proportional to the total length,
+            # so alignment doesn't depend on the decode rate.
+            duration = audio_info.get("duration", 0.0)
+            if max_duration:
+                duration = min(duration, max_duration)
+            if duration > 0:
+                needed_rate = int(resolution * _WAVEFORM_SAMPLES_PER_POINT / duration)
+                target_sample_rate = min(
+                    target_sample_rate, max(needed_rate, _WAVEFORM_MIN_SAMPLE_RATE)
+                )
+
             # Build ffmpeg command to extract PCM data
             cmd = [
                 self.ffmpeg_path,
+                *_QUIET_ARGS,
                 "-i",
                 str(file_path),
                 "-f",
-                "f32le",  # 32-bit float PCM
+                "s16le",  # 16-bit PCM is plenty for a peak envelope
                 "-ac",
                 "1",  # Mono
                 "-ar",
-                str(target_sample_rate),  # Use same sample rate as spectrogram for perfect alignment
+                str(target_sample_rate),
             ]
 
             if max_duration:
@@ -309,10 +518,10 @@ class FFmpegWrapper:
 
             cmd.append("-")  # Output to stdout
 
-            result = subprocess.run(cmd, capture_output=True, check=True, timeout=30)
-
-            # Convert bytes to numpy array
-            audio_data = np.frombuffer(result.stdout, dtype=np.float32)
+            expected = self._estimate_sample_count(
+                file_path, target_sample_rate, 1, max_duration
+            )
+            audio_data = self._read_pcm(cmd, expected, timeout=30, dtype=np.int16)
 
             if len(audio_data) == 0:
                 return None
@@ -320,20 +529,22 @@ class FFmpegWrapper:
             # Downsample to target resolution using evenly-spaced sampling
             # This ensures perfect time alignment across the entire audio duration
             if len(audio_data) > resolution:
-                # Create evenly-spaced indices across the entire audio
+                # Create evenly-spaced segment starts across the entire audio
                 indices = np.linspace(0, len(audio_data), resolution + 1, dtype=int)
 
-                # For each segment between indices, take the max absolute value
-                # This ensures each waveform point represents an equal time interval
-                waveform = np.array([
-                    np.max(np.abs(audio_data[indices[i]:indices[i+1]]))
-                    if indices[i+1] > indices[i]
-                    else np.abs(audio_data[indices[i]]) if indices[i] < len(audio_data) else 0.0
-                    for i in range(resolution)
-                ])
+                # Peak and trough per segment in one pass each, no per-segment
+                # slicing. Rectifying int16 in place would overflow at -32768,
+                # so max|x| = max(peak, -trough) is taken after the cast below.
+                peaks = np.maximum.reduceat(audio_data, indices[:-1])
+                troughs = np.minimum.reduceat(audio_data, indices[:-1])
             else:
-                waveform = np.abs(audio_data)
+                peaks = troughs = audio_data
 
+            # Cast and scale only the reduced points back to -1.0..1.0 floats
+            waveform = np.maximum(
+                peaks.astype(np.float32), np.negative(troughs, dtype=np.float32)
+            )
+            waveform *= np.float32(1.0 / 32768.0)
             return waveform
 
         except subprocess.SubprocessError as e:
@@ -346,6 +557,113 @@ class FFmpegWrapper:
             print(f"Unexpected error extracting waveform: {e}")
             return None
 
+    def _estimate_sample_count(
+        self,
+        file_path: Path,
+        sample_rate: int,
+        channels: int,
+        max_duration: Optional[float] = None,
+    ) -> int:
+        """Estimate how many PCM values ffmpeg will output for a file
+
+        Args:
+            file_path: Path to audio file
+            sample_rate: Output sample rate in Hz
+            channels: Output channel count
+            max_duration: Duration limit in seconds (optional)
+
+        Returns:
+            Estimated number of samples (0 if unknown)
+        """
+        duration = self.get_audio_info(file_path).get("duration", 0.0)
+        if max_duration:
+            duration = min(duration, max_duration)
+
+        # Leave a little headroom so container rounding doesn't overflow
+        return int((duration + 0.1) * sample_rate * channels) if duration > 0 else 0
+
+    def _read_pcm(
+        self,
+        cmd: List[str],
+        expected_samples: int,
+        timeout: Optional[float] = None,
+        dtype: type = np.float32,
+    ) -> np.ndarray:
+        """Run an ffmpeg command that writes raw PCM to stdout and read it
+
+        Output is read straight into one preallocated buffer, avoiding an
+        intermediate bytes object holding the whole decoded stream.
+
+        Args:
+            cmd: FFmpeg command ending in "-" (stdout output)
+            expected_samples: Estimated number of samples (0 if unknown)
+            timeout: Seconds the whole run may take before ffmpeg is killed
+                (None for no limit)
+            dtype: Sample type matching the command's -f option
+                (np.float32 for f32le, np.int16 for s16le)
+
+        Returns:
+            Writable array of samples
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg exits with an error
+            subprocess.TimeoutExpired: If ffmpeg runs past the timeout
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20,
+            **HIDDEN_PROCESS_KWARGS,
+        )
+
+        # Blocking reads can't time out themselves, so a watchdog kills an
+        # ffmpeg that stalls mid-stream; the reads then hit EOF
+        expired = threading.Event()
+
+        def expire() -> None:
+            expired.set()
+            process.kill()
+
+        watchdog = None
+        if timeout is not None:
+            watchdog = threading.Timer(timeout, expire)
+            watchdog.daemon = True
+            watchdog.start()
+        try:
+            itemsize = np.dtype(dtype).itemsize
+            buffer = bytearray(expected_samples * itemsize)
+            filled = 0
+            with memoryview(buffer) as view:
+                while filled < len(buffer):
+                    count = process.stdout.readinto(view[filled:])
+                    if not count:
+                        break
+                    filled += count
+
+            # Drop unused headroom, or append output beyond the estimate
+            del buffer[filled:]
+            buffer += process.stdout.read()
+
+            process.stdout.close()
+            process.wait()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+
+        # A watchdog firing just after a clean exit kills nothing; only a
+        # failed run counts as timed out
+        if process.returncode != 0:
+            if expired.is_set():
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+
+        return np.frombuffer(buffer, dtype=dtype, count=len(buffer) // itemsize)
+
     def build_ffmpeg_command(
         self, input_file: Path, output_file: Path, **params
     ) -> List[str]:
@@ -1,8 +1,19 @@
 import os
 import platform
 import subprocess
+import sys
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
+
+# Popen options for helper processes (ffmpeg, file managers): no console
+# window flash on Windows, and their own session on POSIX so terminal
+# signals aimed at the app don't reach them
+if sys.platform == "win32":
+    HIDDEN_PROCESS_KWARGS: Dict[str, Any] = {
+        "creationflags": subprocess.CREATE_NO_WINDOW
+    }
+else:
+    HIDDEN_PROCESS_KWARGS = {"start_new_session": True}
 
 
 class PlatformUtils:
@@ -60,11 +71,20 @@ class PlatformUtils:
 
         try:
             if system == "Windows":
-                subprocess.run(["explorer", path_str], check=False)
+                cmd = ["explorer", path_str]
             elif system == "Darwin":  # macOS
-                subprocess.run(["open", path_str], check=False)
+                cmd = ["open", path_str]
             else:  # Linux
-                subprocess.run(["xdg-open", path_str], check=False)
+                cmd = ["xdg-open", path_str]
+
+            # Launch detached; waiting on the launcher would block the GUI thread
+            subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **HIDDEN_PROCESS_KWARGS,
+            )
         except Exception as e:
             print(f"Failed to open file manager: {e}")
 
@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import numpy as np
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
@@ -26,6 +27,11 @@ class MemoTableModel(QAbstractTableModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._memos: List[VoiceMemo] = []
+        self._rows: List[Tuple[str, ...]] = []  # Pre-formatted cells per memo
+        self._sort_keys: Tuple[np.ndarray, ...] = ()  # One key array per column
+        self._order = np.arange(0)  # View row -> index into _memos/_rows
+        self._sort_column: Optional[int] = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
         self._headers = ["Name", "Duration", "Codec", "Sample Rate", "Size", "Date"]
 
     def rowCount(self, parent=QModelIndex()):
@@ -38,33 +44,8 @@ class MemoTableModel(QAbstractTableModel):
         if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
             return None
 
-        memo = self._memos[index.row()]
-        col = index.column()
-
-        if col == 0:  # Name
-            return memo.filename
-        elif col == 1:  # Duration
-            return AudioUtils.format_duration(memo.duration)
-        elif col == 2:  # Codec
-            return memo.codec.upper()
-        elif col == 3:  # Sample Rate
-            return f"{memo.sample_rate // 1000}kHz"
-        elif col == 4:  # Size
-            return AudioUtils.format_file_size(memo.file_size)
-        elif col == 5:  # Date
-            # Format date (just the date part)
-            dt = datetime.fromisoformat(memo.created_at)
-            today = datetime.now().date()
-            memo_date = dt.date()
-
-            if memo_date == today:
-                return "Today"
-            elif (today - memo_date).days == 1:
-                return "Yesterday"
-            else:
-                return dt.strftime("%Y-%m-%d")
-
-        return None
+        # Display strings are formatted once in set_memos
+        return self._rows[self._order[index.row()]][index.column()]
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if (
@@ -78,12 +59,102 @@ class MemoTableModel(QAbstractTableModel):
         """Update memos list"""
         self.beginResetModel()
         self._memos = memos
+        created = np.array(
+            [memo.created_at for memo in memos], dtype="datetime64[us]"
+        )
+        self._rows = self._format_rows(memos, created.astype("datetime64[D]"))
+        self._sort_keys = (
+            np.array([memo.filename.lower() for memo in memos], dtype=str),
+            np.array([memo.duration for memo in memos], dtype=np.float64),
+            np.array([memo.codec.lower() for memo in memos], dtype=str),
+            np.array([memo.sample_rate for memo in memos], dtype=np.int64),
+            np.array([memo.file_size for memo in memos], dtype=np.int64),
+            created,
+        )
+        self._order = self._sorted_order()
         self.endResetModel()
 
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows by a column using its key array
+
+        Args:
+            column: Column index
+            order: Sort order
+        """
+        if not 0 <= column < len(self._headers):
+            return
+
+        self._sort_column = column
+        self._sort_order = order
+
+        self.layoutAboutToBeChanged.emit()
+        old_order = self._order
+        self._order = self._sorted_order()
+
+        # Keep selection and other persistent indexes on the same memos
+        new_rows = np.empty_like(self._order)
+        new_rows[self._order] = np.arange(len(self._order))
+        for index in self.persistentIndexList():
+            row = int(new_rows[old_order[index.row()]])
+            self.changePersistentIndex(
+                index, self.index(row, index.column(), index.parent())
+            )
+        self.layoutChanged.emit()
+
+    def _sorted_order(self) -> np.ndarray:
+        """Compute the row order for the current sort column
+
+        Returns:
+            Indices into _memos in display order
+        """
+        if self._sort_column is None or not self._memos:
+            return np.arange(len(self._memos))
+
+        order = np.argsort(self._sort_keys[self._sort_column], kind="stable")
+        if self._sort_order == Qt.SortOrder.DescendingOrder:
+            order = order[::-1]
+        return order
+
+    @staticmethod
+    def _format_rows(
+        memos: List[VoiceMemo], dates: np.ndarray
+    ) -> List[Tuple[str, ...]]:
+        """Format the display strings for every column of every memo
+
+        Args:
+            memos: Memos in row order
+            dates: Creation dates of the memos as datetime64[D]
+
+        Returns:
+            One tuple of column strings per memo
+        """
+        # Bucket all creation dates in one vectorized pass (local date, not
+        # numpy's UTC "today")
+        today = np.datetime64(datetime.now().date(), "D")
+        date_texts = np.where(
+            dates == today,
+            "Today",
+            np.where(
+                dates == today - 1, "Yesterday", np.datetime_as_string(dates)
+            ),
+        ).tolist()
+
+        return [
+            (
+                memo.filename,
+                AudioUtils.format_duration(memo.duration),
+                memo.codec.upper(),
+                f"{memo.sample_rate // 1000}kHz",
+                AudioUtils.format_file_size(memo.file_size),
+                date_text,
+            )
+            for memo, date_text in zip(memos, date_texts)
+        ]
+
     def get_memo(self, row: int) -> Optional[VoiceMemo]:
         """Get memo at row"""
         if 0 <= row < len(self._memos):
-            return self._memos[row]
+            return self._memos[self._order[row]]
         return None
 
 
@@ -139,6 +210,10 @@ class MemoListWidget(QWidget):
         self._table_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self._table_view.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self._table_view.setAlternatingRowColors(True)
+        # Start sorted newest first, matching MemoManager.list_memos
+        self._table_view.horizontalHeader().setSortIndicator(
+            5, Qt.SortOrder.DescendingOrder
+        )
         self._table_view.setSortingEnabled(True)
         self._table_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
 
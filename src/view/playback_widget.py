@@ -1,6 +1,7 @@
+import time
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
@@ -11,8 +12,13 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from src.utils.audio_utils import AudioUtils
 from src.view.style import AppStyle
 
+# Minimum spacing between volume emits / seek preview redraws while dragging
+_VOLUME_EMIT_INTERVAL_NS = 20_000_000
+_SEEK_PREVIEW_INTERVAL_NS = 16_000_000
+
 
 class PlaybackWidget(QWidget):
     """Playback controls widget"""
@@ -32,9 +38,29 @@ class PlaybackWidget(QWidget):
         """
         super().__init__(parent)
 
-        self._is_playing = False
-        self._duration = 0
         self._is_seeking = False
+        self._applied_playing: Optional[bool] = None  # State the buttons show
+        self._last_label_secs = -1  # Whole seconds shown in the current time label
+        self._last_slider_ms = -1  # Last position pushed to the timeline slider
+
+        # Volume drags emit at once if the last emit is old enough, else a
+        # trailing single-shot delivers the latest value. Timestamps keep the
+        # rate bounded even when timer events run late under load.
+        self._pending_volume = 0
+        self._last_emitted_volume = -1
+        self._last_volume_emit_ns = 0
+        self._volume_emit_timer = QTimer(self)
+        self._volume_emit_timer.setSingleShot(True)
+        self._volume_emit_timer.timeout.connect(self._flush_volume)
+
+        # Seek preview label is redrawn at most once per frame while dragging,
+        # throttled the same way
+        self._pending_seek_ms = 0
+        self._last_rendered_ms = -1
+        self._last_preview_ns = 0
+        self._seek_preview_timer = QTimer(self)
+        self._seek_preview_timer.setSingleShot(True)
+        self._seek_preview_timer.timeout.connect(self._flush_seek_preview)
 
         self._setup_ui()
 
@@ -83,9 +109,14 @@ class PlaybackWidget(QWidget):
         self._timeline_slider.setMinimum(0)
         self._timeline_slider.setMaximum(0)
         self._timeline_slider.setValue(0)
+        # Without tracking, valueChanged fires once when a drag ends (and for
+        # clicks/keys), never for intermediate drag positions; sliderMoved
+        # still drives the time preview
+        self._timeline_slider.setTracking(False)
         self._timeline_slider.sliderPressed.connect(self._on_slider_pressed)
         self._timeline_slider.sliderReleased.connect(self._on_slider_released)
         self._timeline_slider.sliderMoved.connect(self._on_slider_moved)
+        self._timeline_slider.valueChanged.connect(self._on_slider_value_changed)
         timeline_layout.addWidget(self._timeline_slider)
 
         # Total time
@@ -119,37 +150,71 @@ class PlaybackWidget(QWidget):
         group.setLayout(group_layout)
         layout.addWidget(group)
 
+    @Slot()
     def _on_play_clicked(self) -> None:
         """Handle play button click"""
         self.play_clicked.emit()
 
+    @Slot()
     def _on_pause_clicked(self) -> None:
         """Handle pause button click"""
         self.pause_clicked.emit()
 
+    @Slot()
     def _on_stop_clicked(self) -> None:
         """Handle stop button click"""
         self.stop_clicked.emit()
 
+    @Slot()
     def _on_slider_pressed(self) -> None:
         """Handle slider press"""
         self._is_seeking = True
+        self._last_rendered_ms = -1  # Label may show playback time since last drag
 
+    @Slot()
     def _on_slider_released(self) -> None:
-        """Handle slider release"""
+        """Handle slider release (the seek itself follows via valueChanged)"""
         self._is_seeking = False
-        position = self._timeline_slider.value()
-        self.seek_requested.emit(position)
 
+    @Slot(int)
+    def _on_slider_value_changed(self, value: int) -> None:
+        """Seek to a position the user committed on the slider
+
+        Programmatic updates are made with signals blocked, so only user
+        input reaches this.
+
+        Args:
+            value: Slider value in milliseconds
+        """
+        self._last_slider_ms = value
+        self.seek_requested.emit(value)
+
+    @Slot(int)
     def _on_slider_moved(self, value: int) -> None:
         """Handle slider movement
 
         Args:
             value: Slider value in milliseconds
         """
-        # Update time label while dragging
-        self._current_time_label.setText(self._format_time(value))
-
+        # Update time label while dragging, coalesced to the latest value
+        self._pending_seek_ms = value
+        elapsed = time.monotonic_ns() - self._last_preview_ns
+        if elapsed >= _SEEK_PREVIEW_INTERVAL_NS:
+            self._seek_preview_timer.stop()
+            self._flush_seek_preview()
+        elif not self._seek_preview_timer.isActive():
+            remaining_ms = -(-(_SEEK_PREVIEW_INTERVAL_NS - elapsed) // 1_000_000)
+            self._seek_preview_timer.start(remaining_ms)
+
+    @Slot()
+    def _flush_seek_preview(self) -> None:
+        """Render the latest dragged position in the time label"""
+        self._last_preview_ns = time.monotonic_ns()
+        if self._pending_seek_ms != self._last_rendered_ms:
+            self._last_rendered_ms = self._pending_seek_ms
+            self._set_current_time(self._pending_seek_ms)
+
+    @Slot(int)
     def _on_volume_changed(self, value: int) -> None:
         """Handle volume change
 
@@ -157,7 +222,22 @@ class PlaybackWidget(QWidget):
             value: Volume value 0-100
         """
         self._volume_label.setText(f"{value}%")
-        self.volume_changed.emit(value / 100.0)
+        self._pending_volume = value
+        elapsed = time.monotonic_ns() - self._last_volume_emit_ns
+        if elapsed >= _VOLUME_EMIT_INTERVAL_NS:
+            self._volume_emit_timer.stop()
+            self._flush_volume()
+        elif not self._volume_emit_timer.isActive():
+            remaining_ms = -(-(_VOLUME_EMIT_INTERVAL_NS - elapsed) // 1_000_000)
+            self._volume_emit_timer.start(remaining_ms)
+
+    @Slot()
+    def _flush_volume(self) -> None:
+        """Emit the latest volume if it differs from the last one sent"""
+        self._last_volume_emit_ns = time.monotonic_ns()
+        if self._pending_volume != self._last_emitted_volume:
+            self._last_emitted_volume = self._pending_volume
+            self.volume_changed.emit(self._pending_volume / 100.0)
 
     def set_playback_state(self, is_playing: bool) -> None:
         """Set playback state
@@ -165,7 +245,10 @@ class PlaybackWidget(QWidget):
         Args:
             is_playing: True if playing
         """
-        self._is_playing = is_playing
+        # Player callbacks repeat states; leave buttons alone if already set
+        if is_playing == self._applied_playing:
+            return
+        self._applied_playing = is_playing
 
         if is_playing:
             self._play_btn.setText("Playing...")
@@ -184,8 +267,28 @@ class PlaybackWidget(QWidget):
         Args:
             position_ms: Position in milliseconds
         """
-        if not self._is_seeking:
-            self._timeline_slider.setValue(position_ms)
+        if self._is_seeking:
+            return
+
+        # Position callbacks often repeat a value (e.g. while paused)
+        if position_ms != self._last_slider_ms:
+            self._last_slider_ms = position_ms
+            with QSignalBlocker(self._timeline_slider):
+                self._timeline_slider.setValue(position_ms)
+        self._set_current_time(position_ms)
+
+    def _set_current_time(self, position_ms: int) -> None:
+        """Show a position in the current time label
+
+        The label text only changes once per second, so ticks within the
+        same second skip formatting and relayout.
+
+        Args:
+            position_ms: Position in milliseconds
+        """
+        seconds = position_ms // 1000
+        if seconds != self._last_label_secs:
+            self._last_label_secs = seconds
             self._current_time_label.setText(self._format_time(position_ms))
 
     def update_duration(self, duration_ms: int) -> None:
@@ -194,8 +297,14 @@ class PlaybackWidget(QWidget):
         Args:
             duration_ms: Duration in milliseconds
         """
-        self._duration = duration_ms
-        self._timeline_slider.setMaximum(duration_ms)
+        # Duration is re-reported on every status change; the slider range
+        # and label only need touching when it actually differs
+        if duration_ms == self._timeline_slider.maximum():
+            return
+
+        with QSignalBlocker(self._timeline_slider):
+            self._timeline_slider.setMaximum(duration_ms)
+        self._last_slider_ms = -1  # A new range may have clamped the value
         self._total_time_label.setText(self._format_time(duration_ms))
 
     def set_enabled(self, enabled: bool) -> None:
@@ -204,6 +313,7 @@ class PlaybackWidget(QWidget):
         Args:
             enabled: True to enable
         """
+        self._applied_playing = None  # Buttons change outside set_playback_state
         self._play_btn.setEnabled(enabled)
         self._timeline_slider.setEnabled(enabled)
 
@@ -227,13 +337,18 @@ class PlaybackWidget(QWidget):
         return self._volume_slider.value() / 100.0
 
     def set_volume(self, level: float) -> None:
-        """Set volume level
+        """Set volume level shown by the slider
+
+        Reflects a volume applied elsewhere, so volume_changed isn't emitted.
 
         Args:
             level: Volume from 0.0 to 1.0
         """
         value = int(level * 100)
-        self._volume_slider.setValue(value)
+        with QSignalBlocker(self._volume_slider):
+            self._volume_slider.setValue(value)
+        self._volume_label.setText(f"{self._volume_slider.value()}%")
+        self._pending_volume = self._last_emitted_volume = value
 
     @staticmethod
     def _format_time(milliseconds: int) -> str:
@@ -245,13 +360,5 @@ class PlaybackWidget(QWidget):
         Returns:
             Formatted time string
         """
-        seconds = milliseconds // 1000
-        minutes = seconds // 60
-        seconds = seconds % 60
-
-        if minutes >= 60:
-            hours = minutes // 60
-            minutes = minutes % 60
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-        return f"{minutes:02d}:{seconds:02d}"
+        # Whole seconds under an hour come straight from the MM:SS lookup table
+        return AudioUtils.format_duration(milliseconds // 1000)
@@ -1,7 +1,16 @@
-from typing import Dict, Optional
-
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtMultimedia import QMediaDevices
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import (
+    QRectF,
+    QSignalBlocker,
+    QStringListModel,
+    Qt,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QBrush, QColor, QPainter, QPaintEvent
+from PySide6.QtMultimedia import QAudioDevice, QMediaDevices
 from PySide6.QtWidgets import (
     QComboBox,
     QGroupBox,
@@ -15,8 +24,97 @@ from PySide6.QtWidgets import (
 
 from src.model.codec_config import CodecPresets
 from src.model.settings import AppSettings
+from src.utils.audio_utils import AudioUtils
 from src.view.style import AppStyle
 
+# (audio inputs, default input), enumerated once and dropped when the OS
+# reports a device change; _media_devices delivers that notification
+_audio_inputs_cache: Optional[Tuple[List[QAudioDevice], QAudioDevice]] = None
+_media_devices: Optional[QMediaDevices] = None
+
+
+def _invalidate_audio_inputs() -> None:
+    """Forget the cached audio input list"""
+    global _audio_inputs_cache
+    _audio_inputs_cache = None
+
+
+def _get_audio_inputs() -> Tuple[List[QAudioDevice], QAudioDevice]:
+    """Get the audio input devices and the default input (cached)
+
+    Returns:
+        Tuple of (input devices, default input device)
+    """
+    global _audio_inputs_cache, _media_devices
+
+    if _media_devices is None:
+        _media_devices = QMediaDevices()
+        _media_devices.audioInputsChanged.connect(_invalidate_audio_inputs)
+
+    if _audio_inputs_cache is None:
+        _audio_inputs_cache = (
+            QMediaDevices.audioInputs(),
+            QMediaDevices.defaultAudioInput(),
+        )
+    return _audio_inputs_cache
+
+
+class VuMeter(QProgressBar):
+    """Level bar painted directly in the colour of its level zone
+
+    Zone colours are fixed brushes, so changing zone is a repaint rather
+    than a stylesheet re-parse and repolish.
+    """
+
+    # Level zones, in order of their brushes
+    ZONE_NORMAL = 0
+    ZONE_HIGH = 1
+    ZONE_CLIP = 2
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        """Initialize VU meter
+
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self._zone = self.ZONE_NORMAL
+        self._track_brush = QBrush(QColor(AppStyle.get_color("border")))
+        self._zone_brushes = tuple(
+            QBrush(QColor(AppStyle.get_color(name)))
+            for name in ("success", "accent", "error")
+        )
+
+    def set_zone(self, zone: int) -> None:
+        """Set the level zone that picks the bar colour
+
+        Args:
+            zone: One of ZONE_NORMAL, ZONE_HIGH, ZONE_CLIP
+        """
+        if zone != self._zone:
+            self._zone = zone
+            self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint the track and the filled level
+
+        Args:
+            event: Paint event
+        """
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        rect = QRectF(self.rect())
+        painter.setBrush(self._track_brush)
+        painter.drawRoundedRect(rect, 3, 3)
+
+        span = self.maximum() - self.minimum()
+        if span > 0 and self.value() > self.minimum():
+            rect.setWidth(rect.width() * (self.value() - self.minimum()) / span)
+            painter.setBrush(self._zone_brushes[self._zone])
+            painter.drawRoundedRect(rect, 3, 3)
+
 
 class RecordingPanel(QWidget):
     """Recording controls panel widget"""
@@ -42,10 +140,23 @@ class RecordingPanel(QWidget):
         """
         super().__init__(parent)
 
-        self._is_recording = False
-        self._is_paused = False
         self._app_settings = app_settings
 
+        # States last applied to the buttons; each setter clears the other's
+        # since both rewrite the record and pause buttons
+        self._applied_recording: Optional[bool] = None
+        self._applied_paused: Optional[bool] = None
+        self._last_timer_secs = -1  # Whole seconds shown in the timer label
+        self._device_id_to_index: Dict[bytes, int] = {}  # Device id -> combo row
+
+        # VU meter repaints are capped at ~30 Hz whatever the level feed rate
+        self._pending_level = 0.0
+        self._last_applied_level = -1
+        self._vu_timer = QTimer(self)
+        self._vu_timer.setSingleShot(True)
+        self._vu_timer.setInterval(33)
+        self._vu_timer.timeout.connect(self._drain_vu)
+
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -99,7 +210,7 @@ class RecordingPanel(QWidget):
         status_layout.addWidget(vu_label)
 
         # VU meter (progress bar)
-        self._vu_meter = QProgressBar()
+        self._vu_meter = VuMeter()
         self._vu_meter.setMaximum(100)
         self._vu_meter.setValue(0)
         self._vu_meter.setTextVisible(False)
@@ -115,9 +226,13 @@ class RecordingPanel(QWidget):
         preset_label = QLabel("Preset:")
         preset_layout.addWidget(preset_label)
 
+        # Presets are filled after the first paint unless an owner (e.g.
+        # MainController, which supplies AppSettings) populates them first
         self._preset_combo = QComboBox()
-        self._populate_presets()
+        self._preset_model = QStringListModel(self)  # Swapped whole on refresh
+        self._preset_combo.setModel(self._preset_model)
         self._preset_combo.currentTextChanged.connect(self._on_preset_changed)
+        QTimer.singleShot(0, self._populate_presets_deferred)
         preset_layout.addWidget(self._preset_combo)
 
         # Settings button
@@ -134,9 +249,11 @@ class RecordingPanel(QWidget):
         device_label = QLabel("Input Device:")
         device_layout.addWidget(device_label)
 
+        # Enumerating OS audio devices is slow; do it after the first paint
         self._device_combo = QComboBox()
-        self._populate_audio_devices()
+        self._device_combo.addItem("Loading devices...", None)
         self._device_combo.currentIndexChanged.connect(self._on_device_changed)
+        QTimer.singleShot(0, self._populate_audio_devices_deferred)
         device_layout.addWidget(self._device_combo)
 
         device_layout.addStretch()
@@ -153,60 +270,98 @@ class RecordingPanel(QWidget):
         else:
             presets = CodecPresets.get_all_presets()
 
-        for preset_name in presets.keys():
-            self._preset_combo.addItem(preset_name)
+        # Replace the list in one model reset; only the final default
+        # selection should notify listeners
+        with QSignalBlocker(self._preset_combo):
+            self._preset_model.setStringList(list(presets))
 
         # Set default to "Voice - Standard"
         index = self._preset_combo.findText("Voice - Standard")
         if index >= 0:
             self._preset_combo.setCurrentIndex(index)
 
+    @Slot()
+    def _populate_presets_deferred(self) -> None:
+        """Fill the preset combo box if nothing has populated it yet"""
+        if self._preset_combo.count() == 0:
+            self._populate_presets()
+
+    @Slot()
+    def _populate_audio_devices_deferred(self) -> None:
+        """Replace the device placeholder and announce the selected device"""
+        with QSignalBlocker(self._device_combo):
+            self._populate_audio_devices()
+
+        # Listeners only saw the placeholder until now
+        device = self._device_combo.currentData()
+        if device:
+            self.device_changed.emit(device)
+
+    def set_app_settings(self, app_settings: AppSettings) -> None:
+        """Use application settings for presets and reload the preset list
+
+        Args:
+            app_settings: Application settings instance
+        """
+        self._app_settings = app_settings
+        self._populate_presets()
+
     def _populate_audio_devices(self) -> None:
         """Populate audio input device combo box"""
 
-        self._device_combo.clear()
+        # Get all audio input devices (enumerated once per device change)
+        devices, default_device = _get_audio_inputs()
 
-        # Get all audio input devices
-        devices = QMediaDevices.audioInputs()
+        self._device_id_to_index = {
+            device.id().data(): i for i, device in enumerate(devices)
+        }
 
-        if not devices:
-            self._device_combo.addItem("No input devices found", None)
-            return
+        # Rebuild silently; only the final default selection should notify
+        with QSignalBlocker(self._device_combo):
+            self._device_combo.clear()
+
+            if not devices:
+                self._device_combo.addItem("No input devices found", None)
+                return
 
-        # Add devices to combo box
-        for device in devices:
-            # Store the device object as user data
-            self._device_combo.addItem(device.description(), device)
+            # Insert all rows in one batch, then attach the device objects
+            # as user data
+            self._device_combo.addItems([device.description() for device in devices])
+            for i, device in enumerate(devices):
+                self._device_combo.setItemData(i, device)
 
-        # Select default device
-        default_device = QMediaDevices.defaultAudioInput()
+        # Select default device by id, without reading the items back
         if default_device:
-            for i in range(self._device_combo.count()):
-                device = self._device_combo.itemData(i)
-                if device and device.id() == default_device.id():
-                    self._device_combo.setCurrentIndex(i)
-                    break
+            index = self._device_id_to_index.get(default_device.id().data())
+            if index is not None:
+                self._device_combo.setCurrentIndex(index)
 
+    @Slot()
     def _on_record_clicked(self) -> None:
         """Handle record button click"""
         self.record_clicked.emit()
 
+    @Slot()
     def _on_pause_clicked(self) -> None:
         """Handle pause button click"""
         self.pause_clicked.emit()
 
+    @Slot()
     def _on_stop_clicked(self) -> None:
         """Handle stop button click"""
         self.stop_clicked.emit()
 
+    @Slot()
     def _on_settings_clicked(self) -> None:
         """Handle settings button click"""
         self.settings_clicked.emit()
 
+    @Slot(str)
     def _on_preset_changed(self, preset_name: str) -> None:
         """Handle preset change"""
         self.preset_changed.emit(preset_name)
 
+    @Slot(int)
     def _on_device_changed(self, index: int) -> None:
         """Handle audio device change"""
         device = self._device_combo.itemData(index)
@@ -227,7 +382,10 @@ class RecordingPanel(QWidget):
         Args:
             is_recording: True if recording
         """
-        self._is_recording = is_recording
+        if is_recording == self._applied_recording:
+            return
+        self._applied_recording = is_recording
+        self._applied_paused = None
 
         if is_recording:
             self._record_btn.setText("Recording...")
@@ -244,7 +402,6 @@ class RecordingPanel(QWidget):
             self._stop_btn.setEnabled(False)
             self._preset_combo.setEnabled(True)
             self._settings_btn.setEnabled(True)
-            self._is_paused = False
 
     def set_paused_state(self, is_paused: bool) -> None:
         """Set paused state
@@ -252,7 +409,10 @@ class RecordingPanel(QWidget):
         Args:
             is_paused: True if paused
         """
-        self._is_paused = is_paused
+        if is_paused == self._applied_paused:
+            return
+        self._applied_paused = is_paused
+        self._applied_recording = None
 
         if is_paused:
             self._pause_btn.setText("Resume")
@@ -267,16 +427,13 @@ class RecordingPanel(QWidget):
         Args:
             duration: Duration in seconds
         """
-        hours = int(duration // 3600)
-        minutes = int((duration % 3600) // 60)
-        seconds = int(duration % 60)
-
-        if hours > 0:
-            time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        else:
-            time_str = f"{minutes:02d}:{seconds:02d}"
+        # The label only changes once per second; skip ticks within it
+        seconds = int(duration)
+        if seconds == self._last_timer_secs:
+            return
 
-        self._timer_label.setText(time_str)
+        self._last_timer_secs = seconds
+        self._timer_label.setText(AudioUtils.format_duration(seconds))
 
     def update_audio_level(self, level: float) -> None:
         """Update VU meter
@@ -284,25 +441,28 @@ class RecordingPanel(QWidget):
         Args:
             level: Audio level from 0.0 to 1.0
         """
-        value = int(level * 100)
+        # Only the latest level is drawn when the timer fires
+        self._pending_level = level
+        if not self._vu_timer.isActive():
+            self._vu_timer.start()
+
+    @Slot()
+    def _drain_vu(self) -> None:
+        """Apply the most recent audio level to the VU meter"""
+        value = int(self._pending_level * 100)
+        if value == self._last_applied_level:
+            return
+
+        self._last_applied_level = value
         self._vu_meter.setValue(value)
 
-        # Change color based on level
+        # Change color based on level: red for clipping, orange for high
         if value > 90:
-            # Red for clipping
-            self._vu_meter.setStyleSheet(
-                f"QProgressBar::chunk {{ background-color: {AppStyle.get_color('error')}; }}"
-            )
+            self._vu_meter.set_zone(VuMeter.ZONE_CLIP)
         elif value > 70:
-            # Orange for high
-            self._vu_meter.setStyleSheet(
-                f"QProgressBar::chunk {{ background-color: {AppStyle.get_color('accent')}; }}"
-            )
+            self._vu_meter.set_zone(VuMeter.ZONE_HIGH)
         else:
-            # Normal color
-            self._vu_meter.setStyleSheet(
-                f"QProgressBar::chunk {{ background-color: {AppStyle.get_color('success')}; }}"
-            )
+            self._vu_meter.set_zone(VuMeter.ZONE_NORMAL)
 
     def get_selected_preset(self) -> str:
         """Get selected preset name
@@ -1,7 +1,7 @@
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QSignalBlocker, Signal, Slot
 from PySide6.QtWidgets import (
     QButtonGroup,
     QCheckBox,
@@ -25,6 +25,7 @@ from PySide6.QtWidgets import (
 
 from src.model.codec_config import CODEC_CONFIGS, CodecConfig, CodecPresets
 from src.model.settings import AppSettings
+from src.utils.ffmpeg_task import FFmpegTask
 from src.utils.ffmpeg_wrapper import FFmpegWrapper
 
 
@@ -57,6 +58,18 @@ class SettingsDialog(QDialog):
         self._settings: dict = {}
         self._app_settings = app_settings  # Store reference to app settings
 
+        # Built-in presets don't change; the combined list is refreshed in
+        # _populate_presets whenever custom presets are added or removed
+        self._builtin_presets = CodecPresets.get_all_presets()
+        self._presets: Dict[str, CodecConfig] = self._builtin_presets
+
+        # General tab fields exist once that tab is first shown
+        self._storage_dir_edit: Optional[QLineEdit] = None
+        self._prefix_edit: Optional[QLineEdit] = None
+
+        # About tab's pending ffmpeg version query
+        self._version_task: Optional[FFmpegTask] = None
+
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -64,21 +77,25 @@ class SettingsDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Tab widget
-        tabs = QTabWidget()
+        self._tabs = QTabWidget()
 
         # Recording tab
         recording_tab = self._create_recording_tab()
-        tabs.addTab(recording_tab, "Recording")
-
-        # General tab
-        general_tab = self._create_general_tab()
-        tabs.addTab(general_tab, "General")
-
-        # About tab
-        about_tab = self._create_about_tab()
-        tabs.addTab(about_tab, "About")
-
-        layout.addWidget(tabs)
+        self._tabs.addTab(recording_tab, "Recording")
+
+        # General and About tabs start as empty pages and are filled in the
+        # first time they're shown
+        self._tab_builders = {}
+        for title, builder in (
+            ("General", self._build_general_tab),
+            ("About", self._build_about_tab),
+        ):
+            page = QWidget()
+            QVBoxLayout(page)
+            self._tab_builders[self._tabs.addTab(page, title)] = builder
+        self._tabs.currentChanged.connect(self._ensure_tab_built)
+
+        layout.addWidget(self._tabs)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -198,10 +215,23 @@ class SettingsDialog(QDialog):
 
         return widget
 
-    def _create_general_tab(self) -> QWidget:
-        """Create general settings tab"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
+    def _ensure_tab_built(self, index: int) -> None:
+        """Build a lazily created tab's contents the first time it's shown
+
+        Args:
+            index: Tab index
+        """
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder(self._tabs.widget(index))
+
+    def _build_general_tab(self, widget: QWidget) -> None:
+        """Fill the general settings tab
+
+        Args:
+            widget: Tab page to populate
+        """
+        layout = widget.layout()
 
         # Storage directory
         storage_group = QGroupBox("Storage")
@@ -237,12 +267,17 @@ class SettingsDialog(QDialog):
         layout.addWidget(naming_group)
 
         layout.addStretch()
-        return widget
 
-    def _create_about_tab(self) -> QWidget:
-        """Create about tab"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
+        # Show settings passed in before the tab existed
+        self._apply_general_settings()
+
+    def _build_about_tab(self, widget: QWidget) -> None:
+        """Fill the about tab
+
+        Args:
+            widget: Tab page to populate
+        """
+        layout = widget.layout()
 
         # App info
         title = QLabel("Easy Voice Memos")
@@ -259,14 +294,18 @@ class SettingsDialog(QDialog):
         ffmpeg_label.setObjectName("titleLabel")
         layout.addWidget(ffmpeg_label)
 
-        ffmpeg = FFmpegWrapper()
-        version_text = ffmpeg.get_version()
+        self._ffmpeg_info_text = QTextEdit()
+        self._ffmpeg_info_text.setReadOnly(True)
+        self._ffmpeg_info_text.setMaximumHeight(100)
+        self._ffmpeg_info_text.setPlainText("Loading FFmpeg info...")
+        layout.addWidget(self._ffmpeg_info_text)
 
-        info_text = QTextEdit()
-        info_text.setReadOnly(True)
-        info_text.setMaximumHeight(100)
-        info_text.setPlainText(version_text)
-        layout.addWidget(info_text)
+        # Query the version on the thread pool so the dialog doesn't block;
+        # get_version spawns ffmpeg with the hidden-window process flags
+        self._version_task = FFmpegTask(FFmpegWrapper().get_version)
+        self._version_task.signals.finished.connect(self._on_version_finished)
+        self._version_task.signals.failed.connect(self._on_version_failed)
+        self._version_task.start()
 
         # Supported codecs
         codecs_label = QLabel("Supported Codecs:")
@@ -279,31 +318,41 @@ class SettingsDialog(QDialog):
         layout.addWidget(codecs_text)
 
         layout.addStretch()
-        return widget
+
+    @Slot(object)
+    def _on_version_finished(self, version: str) -> None:
+        """Show the ffmpeg version line"""
+        self._version_task = None
+        self._ffmpeg_info_text.setPlainText(version)
+
+    @Slot(str)
+    def _on_version_failed(self, error: str) -> None:
+        """Show FFmpeg as unknown if the version query failed"""
+        self._version_task = None
+        self._ffmpeg_info_text.setPlainText("Unknown")
 
     def _populate_presets(self) -> None:
-        """Populate preset combo box with built-in and custom presets"""
-        self._preset_combo.clear()
+        """Populate preset combo box with built-in and custom presets
 
+        Used for the initial list; saves and deletes edit single rows.
+        Signals are blocked while the list is rebuilt, so callers that want
+        the new current preset loaded must do so themselves.
+        """
         # Get all presets (built-in + custom)
         if self._app_settings:
-            all_presets = self._app_settings.get_all_presets()
+            self._presets = self._app_settings.get_all_presets()
         else:
-            all_presets = CodecPresets.get_all_presets()
+            self._presets = self._builtin_presets
 
-        for preset_name in all_presets.keys():
-            self._preset_combo.addItem(preset_name)
+        with QSignalBlocker(self._preset_combo):
+            self._preset_combo.clear()
+            self._preset_combo.addItems(list(self._presets))
 
     def _on_preset_changed(self, preset_name: str) -> None:
         """Handle preset change"""
-        # Get preset from app settings if available, otherwise from built-in
-        if self._app_settings:
-            all_presets = self._app_settings.get_all_presets()
-        else:
-            all_presets = CodecPresets.get_all_presets()
-
-        if preset_name in all_presets:
-            config = all_presets[preset_name]
+        # Presets as of the last _populate_presets, matching the combo
+        config = self._presets.get(preset_name)
+        if config is not None:
             self._load_codec_config(config)
 
     def _on_codec_changed(self, codec_text: str) -> None:
@@ -315,25 +364,29 @@ class SettingsDialog(QDialog):
 
         codec_info = CODEC_CONFIGS[codec_name]
 
-        # Update sample rates
-        self._sample_rate_combo.clear()
-        for rate in codec_info["sample_rates"]:
-            self._sample_rate_combo.addItem(f"{rate} Hz", rate)
+        # Update sample rates (rebuilt in one batch without per-item signals)
+        sample_rates = codec_info["sample_rates"]
+        with QSignalBlocker(self._sample_rate_combo):
+            self._sample_rate_combo.clear()
+            self._sample_rate_combo.addItems([f"{rate} Hz" for rate in sample_rates])
+            for i, rate in enumerate(sample_rates):
+                self._sample_rate_combo.setItemData(i, rate)
 
         # Update bit rates
         bit_rates = codec_info.get("bit_rates")
-        if bit_rates:
+        with QSignalBlocker(self._bitrate_combo):
             self._bitrate_combo.clear()
-            self._bitrate_combo.setEnabled(True)
-            self._bitrate_label.setEnabled(True)
-            for rate in bit_rates:
-                self._bitrate_combo.addItem(f"{rate // 1000} kbps", rate)
-        else:
-            # Lossless codec
-            self._bitrate_combo.clear()
-            self._bitrate_combo.setEnabled(False)
-            self._bitrate_label.setEnabled(False)
-            self._bitrate_combo.addItem("Lossless", None)
+            if bit_rates:
+                self._bitrate_combo.addItems(
+                    [f"{rate // 1000} kbps" for rate in bit_rates]
+                )
+                for i, rate in enumerate(bit_rates):
+                    self._bitrate_combo.setItemData(i, rate)
+            else:
+                # Lossless codec
+                self._bitrate_combo.addItem("Lossless", None)
+        self._bitrate_combo.setEnabled(bool(bit_rates))
+        self._bitrate_label.setEnabled(bool(bit_rates))
 
     def _on_browse_storage(self) -> None:
         """Browse for storage directory"""
@@ -375,9 +428,15 @@ class SettingsDialog(QDialog):
                     )
                     return
 
-                # Refresh preset list
-                self._populate_presets()
-                self._preset_combo.setCurrentText(name)
+                # Add the new name (a re-saved custom preset keeps its row)
+                # and select it; its settings are already on screen
+                self._presets[name] = config
+                index = self._preset_combo.findText(name)
+                with QSignalBlocker(self._preset_combo):
+                    if index < 0:
+                        index = self._preset_combo.count()
+                        self._preset_combo.insertItem(index, name)
+                    self._preset_combo.setCurrentIndex(index)
 
                 QMessageBox.information(
                     self, "Preset Saved", f"Custom preset '{name}' has been saved!"
@@ -393,7 +452,7 @@ class SettingsDialog(QDialog):
         current_preset = self._preset_combo.currentText()
 
         # Check if it's a built-in preset
-        if current_preset in CodecPresets.get_all_presets():
+        if current_preset in self._builtin_presets:
             QMessageBox.warning(
                 self,
                 "Cannot Delete",
@@ -415,8 +474,13 @@ class SettingsDialog(QDialog):
             if self._app_settings:
                 success = self._app_settings.remove_custom_preset(current_preset)
                 if success:
-                    # Refresh preset list
-                    self._populate_presets()
+                    # Drop its row and load the preset now selected
+                    self._presets.pop(current_preset, None)
+                    with QSignalBlocker(self._preset_combo):
+                        self._preset_combo.removeItem(
+                            self._preset_combo.findText(current_preset)
+                        )
+                    self._on_preset_changed(self._preset_combo.currentText())
 
                     QMessageBox.information(
                         self,
@@ -445,10 +509,18 @@ class SettingsDialog(QDialog):
             channels=channels,
         )
 
+        # Unvisited General tab fields keep their initial values
+        if self._storage_dir_edit is not None:
+            storage_directory = self._storage_dir_edit.text()
+            default_file_prefix = self._prefix_edit.text()
+        else:
+            storage_directory = self._settings.get("storage_directory", "")
+            default_file_prefix = self._settings.get("default_file_prefix", "memo")
+
         # Build settings dict
         self._settings = {
-            "storage_directory": self._storage_dir_edit.text(),
-            "default_file_prefix": self._prefix_edit.text(),
+            "storage_directory": storage_directory,
+            "default_file_prefix": default_file_prefix,
             "auto_convert_after_recording": self._auto_convert_check.isChecked(),
             "keep_original_wav": self._keep_wav_check.isChecked(),
             "last_preset": self._preset_combo.currentText(),
@@ -462,10 +534,12 @@ class SettingsDialog(QDialog):
 
     def _load_codec_config(self, config: CodecConfig) -> None:
         """Load codec configuration into UI"""
-        # Set codec
+        # Set codec, rebuilding the rate combos once and only if it changed
         index = self._codec_combo.findData(config.codec_name)
-        if index >= 0:
-            self._codec_combo.setCurrentIndex(index)
+        if index >= 0 and index != self._codec_combo.currentIndex():
+            with QSignalBlocker(self._codec_combo):
+                self._codec_combo.setCurrentIndex(index)
+            self._on_codec_changed(self._codec_combo.currentText())
 
         # Set sample rate
         index = self._sample_rate_combo.findData(config.sample_rate)
@@ -492,12 +566,7 @@ class SettingsDialog(QDialog):
     def set_settings(self, settings: dict) -> None:
         """Set initial settings"""
         self._settings = settings
-
-        if "storage_directory" in settings:
-            self._storage_dir_edit.setText(settings["storage_directory"])
-
-        if "default_file_prefix" in settings:
-            self._prefix_edit.setText(settings["default_file_prefix"])
+        self._apply_general_settings()
 
         if "auto_convert_after_recording" in settings:
             self._auto_convert_check.setChecked(
@@ -511,3 +580,14 @@ class SettingsDialog(QDialog):
             index = self._preset_combo.findText(settings["last_preset"])
             if index >= 0:
                 self._preset_combo.setCurrentIndex(index)
+
+    def _apply_general_settings(self) -> None:
+        """Show stored settings in the General tab fields, if built"""
+        if self._storage_dir_edit is None:
+            return
+
+        if "storage_directory" in self._settings:
+            self._storage_dir_edit.setText(self._settings["storage_directory"])
+
+        if "default_file_prefix" in self._settings:
+            self._prefix_edit.setText(self._settings["default_file_prefix"])
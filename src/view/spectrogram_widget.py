@@ -1,15 +1,28 @@
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
-from PySide6.QtCore import QPointF, QRect, Qt, Signal
+from PySide6.QtCore import (
+    QEvent,
+    QLine,
+    QPointF,
+    QRect,
+    QRectF,
+    Qt,
+    QTimer,
+    Signal,
+    Slot,
+)
 from PySide6.QtGui import (
     QBrush,
     QColor,
+    QFont,
+    QFontMetrics,
     QImage,
     QMouseEvent,
     QPainter,
     QPaintEvent,
     QPen,
+    QPixmap,
     QWheelEvent,
 )
 from PySide6.QtWidgets import QWidget
@@ -19,6 +32,25 @@ from src.view.style import AppStyle
 if TYPE_CHECKING:
     from src.model.viewport_state import ViewportState
 
+# Amplitude color map (Black -> Blue -> Cyan -> Yellow -> White) as
+# piecewise-linear stops; 0.25 is repeated for the step up to cyan's green
+_COLOR_STOPS = np.array([0.0, 0.25, 0.25, 0.5, 0.75, 1.0])
+_COLOR_STOP_RGB = np.array(
+    [
+        [0, 0, 0],
+        [0, 0, 100],
+        [0, 100, 100],
+        [0, 255, 255],
+        [255, 255, 0],
+        [255, 255, 255],
+    ],
+    dtype=np.float64,
+)
+
+# Key frequencies labelled on the y-axis
+_FREQ_LABELS_HZ = np.array([100, 500, 1000, 2000, 4000, 8000])
+_FREQ_LABEL_TEXTS = ("100", "500", "1k", "2k", "4k", "8k")
+
 
 class SpectrogramWidget(QWidget):
     """Custom widget for spectrogram visualization
@@ -42,35 +74,92 @@ class SpectrogramWidget(QWidget):
         # Spectrogram data (2D numpy array: [time_bins, freq_bins])
         self._spectrogram_data: Optional[np.ndarray] = None
         self._frequency_bins: Optional[np.ndarray] = None  # Hz values for y-axis
+        self._freq_labels: List[Tuple[float, str]] = []  # (height ratio, text)
+        self._spectrogram_idx: Optional[np.ndarray] = None  # uint8 color indices
+        # Live recording history; the newest _live_count rows are shown
+        self._live_data: Optional[np.ndarray] = None
+        self._live_idx: Optional[np.ndarray] = None
+        self._live_count = 0
         self._playback_position = 0.0  # 0.0 to 1.0
+        self._painted_pos_x: Optional[int] = None  # Line x in the last paint
         self._is_recording = False
         self._is_loading = False
-        self._cached_image: Optional[QImage] = None  # Cache rendered image
+        # Rendered spectrogram image (None when stale). It is _index_image,
+        # which wraps _index_buf; both are reused while the shape holds
+        self._cached_image: Optional[QImage] = None
+        self._index_buf: Optional[np.ndarray] = None
+        self._index_image: Optional[QImage] = None
+        self._cached_stride = 1  # Time bins pooled per cached image column
+
+        # Cached image scaled to the widget for the current view
+        self._view_image: Optional[QImage] = None
+        self._view_key: Optional[tuple] = None
 
         # Viewport state (for zoom/pan)
         self._viewport_state: Optional["ViewportState"] = None
 
+        # Grid lines pre-rendered at the current widget size
+        self._grid_pixmap: Optional[QPixmap] = None
+
         # Mouse interaction tracking
         self._mouse_press_pos: Optional[QPointF] = None
         self._is_dragging = False
         self._drag_start_pan = 0.0
 
+        # Drag pans are applied at most once per ~frame
+        self._pending_pan_dx = 0.0
+        self._pan_timer = QTimer(self)
+        self._pan_timer.setSingleShot(True)
+        self._pan_timer.setInterval(8)
+        self._pan_timer.timeout.connect(self._flush_pan)
+
+        # Pans and wheel zooms scale the image with fast sampling; once input
+        # has been idle for a moment, one smooth redraw follows
+        self._interactive = False
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(150)
+        self._settle_timer.timeout.connect(self._on_interaction_settled)
+
         # Visual settings - use app theme colors
         self._background_color = QColor(AppStyle.get_color("surface"))
         self._grid_color = QColor(AppStyle.get_color("border"))
         self._position_color = QColor(AppStyle.get_color("accent"))
         self._text_color = QColor(AppStyle.get_color("text_primary"))
+        self._placeholder_color = QColor(AppStyle.get_color("text_secondary"))
+
+        # Pens and fonts reused by every paint
+        self._grid_pen = QPen(self._grid_color, 1, Qt.PenStyle.DotLine)
+        self._position_pen = QPen(self._position_color, 2)
+        self._label_pen = QPen(self._text_color, 1)
+        self._loading_pen = QPen(self._text_color, 2)
+        self._placeholder_pen = QPen(self._placeholder_color, 1)
+        self._update_fonts()
 
         # Color map for amplitude (dB scale)
         self._min_db = -80.0  # Minimum dB to display (noise floor)
         self._max_db = 0.0  # Maximum dB (0 dB reference)
 
+        # Color map sampled once into the 256-entry color table of the
+        # indexed spectrogram image
+        levels = np.linspace(0.0, 1.0, 256)
+        lut = np.stack(
+            [
+                np.interp(levels, _COLOR_STOPS, _COLOR_STOP_RGB[:, channel])
+                for channel in range(3)
+            ],
+            axis=1,
+        ).astype(np.uint8)
+        self._color_table = [QColor(r, g, b).rgb() for r, g, b in lut.tolist()]
+
+        # Every paint covers the whole widget, so Qt needn't clear it first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+
         # Set minimum size
         self.setMinimumHeight(150)
         self.setMinimumWidth(400)
-
-        # Enable mouse tracking
-        self.setMouseTracking(True)
+        # No mouse tracking: move events are only acted on while a button is
+        # held (drag panning), which Qt delivers without it
 
     def set_spectrogram_data(
         self, data: np.ndarray, freq_bins: Optional[np.ndarray] = None
@@ -81,14 +170,69 @@ class SpectrogramWidget(QWidget):
             data: 2D numpy array [time_bins, freq_bins] with dB values
             freq_bins: 1D array of frequency values in Hz (optional)
         """
+        # STFT output is already float32 (no copy); older caches may be float64
+        data = np.asarray(data, dtype=np.float32)
         self._spectrogram_data = data
         if freq_bins is not None:
             self._frequency_bins = freq_bins
+            self._update_freq_labels()
+
+        self._spectrogram_idx = self._quantize(data)
 
         # Invalidate cached image when data changes
         self._cached_image = None
         self.update()
 
+    def append_spectrogram_slice(
+        self, magnitude_slice: np.ndarray, freq_bins: np.ndarray, max_slices: int
+    ) -> None:
+        """Append one live STFT slice (for recording)
+
+        Older slices are shifted in place and only the new one is quantized,
+        so each audio chunk costs one row instead of a rebuild of the history.
+
+        Args:
+            magnitude_slice: 1D array of dB values for one time bin
+            freq_bins: 1D array of frequency values in Hz
+            max_slices: Number of most recent slices to show
+        """
+        shape = (max_slices, len(magnitude_slice))
+        if self._live_data is None or self._live_data.shape != shape:
+            self._live_data = np.empty(shape, dtype=np.float32)
+            self._live_idx = np.empty(shape, dtype=np.uint8)
+            self._live_count = 0
+            self._frequency_bins = freq_bins
+            self._update_freq_labels()
+
+        self._live_data[:-1] = self._live_data[1:]
+        self._live_data[-1] = magnitude_slice
+        self._live_idx[:-1] = self._live_idx[1:]
+        self._live_idx[-1:] = self._quantize(self._live_data[-1:])
+        self._live_count = min(self._live_count + 1, max_slices)
+
+        # Contiguous views of the filled tail, no copies
+        self._spectrogram_data = self._live_data[-self._live_count :]
+        self._spectrogram_idx = self._live_idx[-self._live_count :]
+        self._cached_image = None
+        self.update()
+
+    def _quantize(self, data: np.ndarray) -> np.ndarray:
+        """Map dB values to color table indices
+
+        Only 256 colors are shown, so the image is built from indices
+        quantized once per value (scaled and clipped in one float32 array).
+
+        Args:
+            data: Array of dB values
+
+        Returns:
+            uint8 array of color table indices, same shape as data
+        """
+        scaled = np.subtract(data, self._min_db, dtype=np.float32)
+        scaled *= 255.0 / (self._max_db - self._min_db)
+        np.clip(scaled, 0.0, 255.0, out=scaled)
+        return scaled.astype(np.uint8)
+
     def set_playback_position(self, position: float) -> None:
         """Set playback position indicator
 
@@ -96,7 +240,14 @@ class SpectrogramWidget(QWidget):
             position: Position from 0.0 to 1.0
         """
         self._playback_position = max(0.0, min(1.0, position))
-        self.update()
+
+        # Repaint only the strips under the old and new line
+        x = self._position_x()
+        if x == self._painted_pos_x:
+            return
+        for strip_x in (self._painted_pos_x, x):
+            if strip_x is not None:
+                self.update(QRect(strip_x - 2, 0, 5, self.height()))
 
     def set_recording_mode(self, is_recording: bool) -> None:
         """Set recording mode
@@ -107,6 +258,7 @@ class SpectrogramWidget(QWidget):
         self._is_recording = is_recording
         if is_recording:
             self._playback_position = 0.0
+            self._live_data = None  # Start a fresh live history
         self.update()
 
     def set_loading_state(self, is_loading: bool) -> None:
@@ -136,14 +288,16 @@ class SpectrogramWidget(QWidget):
         if viewport_state:
             viewport_state.viewport_changed.connect(self.update)
 
-        # Invalidate cache since viewport affects rendering
-        self._cached_image = None
         self.update()
 
     def clear(self) -> None:
         """Clear spectrogram display"""
         self._spectrogram_data = None
+        self._spectrogram_idx = None
+        self._live_data = None
+        self._live_idx = None
         self._frequency_bins = None
+        self._freq_labels = []
         self._playback_position = 0.0
         self._is_recording = False
         self._is_loading = False
@@ -156,52 +310,75 @@ class SpectrogramWidget(QWidget):
         Args:
             event: Paint event
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Draw background
-        painter.fillRect(self.rect(), self._background_color)
+        if not self.isVisible() or self.width() <= 0 or self.height() <= 0:
+            return
 
-        # Draw grid lines
-        self._draw_grid(painter)
+        # No Antialiasing hint: only images, axis-aligned lines and text are
+        # drawn, and text keeps QPainter's default TextAntialiasing
+        painter = QPainter(self)
 
         # Handle different states
-        if self._is_loading:
-            self._draw_loading_indicator(painter)
-        elif self._spectrogram_data is not None and len(self._spectrogram_data) > 0:
-            self._draw_spectrogram(painter)
-        elif self._is_recording:
-            self._draw_recording_indicator(painter)
+        has_data = (
+            self._spectrogram_data is not None and len(self._spectrogram_data) > 0
+        )
+        if has_data and not self._is_loading:
+            # Opaque image covers the whole widget, background and grid included
+            self._draw_spectrogram(painter, event.rect())
         else:
-            self._draw_placeholder(painter)
+            painter.fillRect(self.rect(), self._background_color)
+            self._draw_grid(painter)
+            if self._is_loading:
+                self._draw_loading_indicator(painter)
+            elif self._is_recording:
+                self._draw_recording_indicator(painter)
+            else:
+                self._draw_placeholder(painter)
 
         # Draw playback position
-        if self._playback_position > 0.0 and not self._is_recording:
-            self._draw_position_indicator(painter)
+        self._painted_pos_x = self._position_x()
+        if self._painted_pos_x is not None:
+            self._draw_position_indicator(painter, self._painted_pos_x)
 
     def _draw_grid(self, painter: QPainter) -> None:
-        """Draw grid lines
+        """Draw grid lines from a pixmap rendered once per widget size
 
         Args:
             painter: QPainter object
         """
-        painter.setPen(QPen(self._grid_color, 1, Qt.PenStyle.DotLine))
-
-        # Horizontal lines (frequency markers)
-        for i in range(1, 5):
-            y = int(self.height() * i / 5)
-            painter.drawLine(0, y, self.width(), y)
-
-        # Vertical lines (time markers)
-        for i in range(1, 10):
-            x = int(self.width() * i / 10)
-            painter.drawLine(x, 0, x, self.height())
-
-    def _draw_spectrogram(self, painter: QPainter) -> None:
+        if self._grid_pixmap is None:
+            dpr = self.devicePixelRatioF()
+            self._grid_pixmap = QPixmap(self.size() * dpr)
+            self._grid_pixmap.setDevicePixelRatio(dpr)
+            self._grid_pixmap.fill(Qt.GlobalColor.transparent)
+
+            # Lines are axis-aligned, so no antialiasing
+            grid_painter = QPainter(self._grid_pixmap)
+            grid_painter.setPen(self._grid_pen)
+
+            width = self.width()
+            height = self.height()
+
+            # Horizontal lines (frequency markers)
+            lines = []
+            for i in range(1, 5):
+                y = int(height * i / 5)
+                lines.append(QLine(0, y, width, y))
+
+            # Vertical lines (time markers)
+            for i in range(1, 10):
+                x = int(width * i / 10)
+                lines.append(QLine(x, 0, x, height))
+            grid_painter.drawLines(lines)
+            grid_painter.end()
+
+        painter.drawPixmap(0, 0, self._grid_pixmap)
+
+    def _draw_spectrogram(self, painter: QPainter, dirty: QRect) -> None:
         """Draw spectrogram as color heatmap (with QImage caching and viewport support)
 
         Args:
             painter: QPainter object
+            dirty: Region being repainted
         """
         if self._spectrogram_data is None or len(self._spectrogram_data) == 0:
             return
@@ -220,105 +397,101 @@ class SpectrogramWidget(QWidget):
 
             start_bin = max(0, min(start_bin, time_bins - 1))
             end_bin = max(start_bin + 1, min(end_bin, time_bins))
-            visible_data = self._spectrogram_data[start_bin:end_bin, :]
         else:
-            visible_data = self._spectrogram_data
-
-        # Check cache validity (size and viewport)
-        cache_valid = (
-            self._cached_image is not None
-            and self._cached_image.width() == self.width()
-            and self._cached_image.height() == self.height()
-        )
-
-        # For now, invalidate cache on viewport change (can optimize later)
-        if self._viewport_state and self._viewport_state.zoom_level != 1.0:
-            cache_valid = False
-
-        if cache_valid and self._viewport_state is None:
-            painter.drawImage(0, 0, self._cached_image)
-            self._draw_frequency_labels(painter)
-            return
-
-        # Render visible portion to QImage
-        visible_time_bins = visible_data.shape[0]
-
-        # Create image at visible spectrogram resolution
-        image = QImage(visible_time_bins, freq_bins, QImage.Format.Format_RGB888)
-
-        # Normalize visible spectrogram data to 0-1 range
-        spec_normalized = np.clip(
-            (visible_data - self._min_db) / (self._max_db - self._min_db),
-            0.0,
-            1.0,
-        )
-
-        # Fill image with colors based on amplitude
-        for t in range(visible_time_bins):
-            for f in range(freq_bins):
-                amplitude = spec_normalized[t, f]
-                color = self._amplitude_to_color(amplitude)
-                # Note: Image is drawn bottom-to-top for frequencies (low at bottom)
-                image.setPixelColor(t, freq_bins - 1 - f, color)
-
-        # Scale to widget size
-        scaled_image = image.scaled(
+            start_bin, end_bin = 0, time_bins
+
+        # Long recordings are max-pooled in time so the image has roughly one
+        # column per pixel of the visible span; power-of-two strides mean
+        # position ticks, pans and most zoom/resize steps reuse the image
+        visible_bins = end_bin - start_bin
+        stride = 1
+        if visible_bins > 2 * max(1, self.width()):
+            stride = 1 << ((visible_bins // max(1, self.width())).bit_length() - 1)
+        if self._cached_image is None or stride != self._cached_stride:
+            self._build_image(stride)
+
+        # The visible columns are scaled to the widget size once per view, so
+        # position ticks and other repaints are a 1:1 blit
+        view_key = (
             self.width(),
             self.height(),
-            Qt.AspectRatioMode.IgnoreAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
+            start_bin,
+            end_bin,
+            stride,
+            self._interactive,
         )
+        if view_key != self._view_key:
+            self._view_key = view_key
+            self._render_view(
+                QRectF(start_bin / stride, 0, visible_bins / stride, freq_bins)
+            )
 
-        # Cache if no viewport transformation
-        if self._viewport_state is None or self._viewport_state.zoom_level == 1.0:
-            self._cached_image = scaled_image
+        # Position ticks repaint thin strips; copy just that part of the view
+        # and leave the labels alone unless the strip reaches them
+        dpr = self._view_image.devicePixelRatio()
+        source = QRectF(
+            dirty.x() * dpr, dirty.y() * dpr, dirty.width() * dpr, dirty.height() * dpr
+        )
+        painter.drawImage(QRectF(dirty), self._view_image, source)
+        if dirty.left() < self._label_extent:
+            self._draw_frequency_labels(painter)
 
-        # Draw the image
-        painter.drawImage(0, 0, scaled_image)
-        self._draw_frequency_labels(painter)
+    def _render_view(self, source: QRectF) -> None:
+        """Scale part of the cached image into the widget-sized view image
 
-    def _amplitude_to_color(self, amplitude: float) -> QColor:
-        """Map normalized amplitude (0-1) to color
+        Args:
+            source: Region of the cached image to show
+        """
+        dpr = self.devicePixelRatioF()
+        if self._view_image is None or self._view_image.size() != self.size() * dpr:
+            self._view_image = QImage(self.size() * dpr, QImage.Format.Format_RGB32)
+            self._view_image.setDevicePixelRatio(dpr)
+
+        # Pans and zooms in progress use fast sampling
+        view_painter = QPainter(self._view_image)
+        view_painter.setRenderHint(
+            QPainter.RenderHint.SmoothPixmapTransform, not self._interactive
+        )
+        view_painter.drawImage(QRectF(self.rect()), self._cached_image, source)
+        view_painter.end()
 
-        Uses a perceptually uniform gradient:
-        Black → Blue → Cyan → Yellow
+    def _build_image(self, stride: int) -> None:
+        """Render the whole spectrogram into the cached image
 
         Args:
-            amplitude: Normalized amplitude from 0.0 (quiet) to 1.0 (loud)
-
-        Returns:
-            QColor for the given amplitude
+            stride: Number of time bins max-pooled into each image column
         """
-        # Clamp to valid range
-        amplitude = max(0.0, min(1.0, amplitude))
-
-        # Multi-stop gradient (inferno/viridis-like)
-        if amplitude < 0.25:
-            # Black to dark blue
-            t = amplitude / 0.25
-            r = int(t * 0)
-            g = int(t * 0)
-            b = int(t * 100)
-        elif amplitude < 0.5:
-            # Dark blue to cyan
-            t = (amplitude - 0.25) / 0.25
-            r = int(t * 0)
-            g = int(100 + t * 155)
-            b = int(100 + t * 155)
-        elif amplitude < 0.75:
-            # Cyan to yellow
-            t = (amplitude - 0.5) / 0.25
-            r = int(t * 255)
-            g = 255
-            b = int(255 - t * 255)
-        else:
-            # Yellow to white
-            t = (amplitude - 0.75) / 0.25
-            r = 255
-            g = 255
-            b = int(t * 255)
+        # Indices rise with dB, so pooling them equals pooling the dB values
+        indices = self._spectrogram_idx
+        if stride > 1:
+            # Max keeps short transients visible after pooling
+            indices = np.maximum.reduceat(
+                indices, np.arange(0, indices.shape[0], stride), axis=0
+            )
+        columns, freq_bins = indices.shape
+
+        # One byte per pixel, colored through the table at blit time. QImage
+        # wraps the buffer without copying and keeps its pointer, so a new
+        # pair is only made when the image dimensions change. Rows are padded
+        # to 32-bit alignment
+        row_bytes = (columns + 3) & ~3
+        shape = (freq_bins, row_bytes)
+        if self._index_buf is None or self._index_buf.shape != shape:
+            self._index_buf = np.empty(shape, dtype=np.uint8)
+            self._index_image = QImage(
+                self._index_buf.data,
+                columns,
+                freq_bins,
+                row_bytes,
+                QImage.Format.Format_Indexed8,
+            )
+            self._index_image.setColorTable(self._color_table)
 
-        return QColor(r, g, b)
+        # Rows are frequencies, drawn bottom-to-top (low at bottom)
+        np.copyto(self._index_buf[:, :columns], indices[:, ::-1].T)
+        self._cached_stride = stride
+        self._cached_image = self._index_image
+        self._view_key = None
 
     def _draw_frequency_labels(self, painter: QPainter) -> None:
         """Draw frequency labels on y-axis
@@ -326,35 +499,35 @@ class SpectrogramWidget(QWidget):
         Args:
             painter: QPainter object
         """
-        if self._frequency_bins is None or len(self._frequency_bins) == 0:
+        if not self._freq_labels:
             return
 
-        painter.setPen(QPen(self._text_color, 1))
-        font = painter.font()
-        font.setPointSize(8)
-        painter.setFont(font)
-
-        # Draw labels at key frequencies
-        freq_labels = [100, 500, 1000, 2000, 4000, 8000]  # Hz
-
-        for freq in freq_labels:
-            if freq < self._frequency_bins[0] or freq > self._frequency_bins[-1]:
-                continue
+        painter.setPen(self._label_pen)
+        painter.setFont(self._label_font)
 
-            # Find closest frequency bin
-            idx = np.argmin(np.abs(self._frequency_bins - freq))
+        height = self.height()
+        for height_ratio, label in self._freq_labels:
+            painter.drawText(5, int(height * height_ratio) - 2, label)
 
-            # Convert to y position (inverted - high freq at top)
-            freq_ratio = idx / len(self._frequency_bins)
-            y = int(self.height() * (1 - freq_ratio))
+    def _update_freq_labels(self) -> None:
+        """Work out which frequency labels to draw, and at what height"""
+        self._freq_labels = []
+        if self._frequency_bins is None or len(self._frequency_bins) == 0:
+            return
 
-            # Draw label
-            if freq >= 1000:
-                label = f"{freq//1000}k"
-            else:
-                label = str(freq)
+        # Bins are ascending, so one binary search finds every label's bin
+        num_bins = len(self._frequency_bins)
+        indices = np.searchsorted(self._frequency_bins, _FREQ_LABELS_HZ)
+        in_range = (_FREQ_LABELS_HZ >= self._frequency_bins[0]) & (
+            _FREQ_LABELS_HZ <= self._frequency_bins[-1]
+        )
 
-            painter.drawText(5, y - 2, label)
+        for idx, label, visible in zip(
+            indices.tolist(), _FREQ_LABEL_TEXTS, in_range.tolist()
+        ):
+            if visible:
+                # Fraction of the height from the top (high freq at top)
+                self._freq_labels.append((1 - idx / num_bins, label))
 
     def _draw_recording_indicator(self, painter: QPainter) -> None:
         """Draw recording indicator
@@ -362,10 +535,8 @@ class SpectrogramWidget(QWidget):
         Args:
             painter: QPainter object
         """
-        painter.setPen(QPen(self._position_color, 2))
-        font = painter.font()
-        font.setPointSize(14)
-        painter.setFont(font)
+        painter.setPen(self._position_pen)
+        painter.setFont(self._indicator_font)
 
         text = "● RECORDING..."
         painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, text)
@@ -376,10 +547,8 @@ class SpectrogramWidget(QWidget):
         Args:
             painter: QPainter object
         """
-        painter.setPen(QPen(QColor(AppStyle.get_color("text_secondary")), 1))
-        font = painter.font()
-        font.setPointSize(12)
-        painter.setFont(font)
+        painter.setPen(self._placeholder_pen)
+        painter.setFont(self._message_font)
 
         text = "No audio loaded"
         painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, text)
@@ -390,36 +559,42 @@ class SpectrogramWidget(QWidget):
         Args:
             painter: QPainter object
         """
-        painter.setPen(QPen(self._text_color, 2))
-        font = painter.font()
-        font.setPointSize(12)
-        painter.setFont(font)
+        painter.setPen(self._loading_pen)
+        painter.setFont(self._message_font)
 
         text = "Computing spectrogram..."
         painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, text)
 
-    def _draw_position_indicator(self, painter: QPainter) -> None:
-        """Draw playback position indicator with viewport support
+    def _draw_position_indicator(self, painter: QPainter, x: int) -> None:
+        """Draw playback position indicator
 
         Args:
             painter: QPainter object
+            x: Widget x coordinate from _position_x
+        """
+        painter.setPen(self._position_pen)
+        painter.drawLine(x, 0, x, self.height())
+
+    def _position_x(self) -> Optional[int]:
+        """Get the x of the playback position indicator, with viewport support
+
+        Returns:
+            Widget x coordinate, or None if the indicator isn't shown
         """
+        if self._playback_position <= 0.0 or self._is_recording:
+            return None
+
         # Use viewport transformation if available
         if self._viewport_state:
             # Only draw if position is visible in viewport
             if not self._viewport_state.is_time_visible(self._playback_position):
-                return
-            x = int(
+                return None
+            return int(
                 self._viewport_state.time_to_screen(
                     self._playback_position, self.width()
                 )
             )
-        else:
-            x = int(self.width() * self._playback_position)
-
-        # Draw vertical line
-        painter.setPen(QPen(self._position_color, 2))
-        painter.drawLine(x, 0, x, self.height())
+        return int(self.width() * self._playback_position)
 
     def wheelEvent(self, event: QWheelEvent) -> None:
         """Handle mouse wheel for zooming
@@ -438,10 +613,10 @@ class SpectrogramWidget(QWidget):
         # Zoom in/out based on wheel delta
         delta = event.angleDelta().y()
         zoom_factor = 1.1 if delta > 0 else 1 / 1.1
-        new_zoom = np.clip(
-            self._viewport_state.zoom_level * zoom_factor, 1.0, 50.0
-        )
+        new_zoom = max(1.0, min(50.0, self._viewport_state.zoom_level * zoom_factor))
 
+        self._interactive = True
+        self._settle_timer.start()
         self._viewport_state.set_zoom(new_zoom, center_time)
         event.accept()
 
@@ -468,19 +643,29 @@ class SpectrogramWidget(QWidget):
             delta = event.position() - self._mouse_press_pos
             if not self._is_dragging and delta.manhattanLength() > 5:
                 self._is_dragging = True
+                self._interactive = True
+                self._settle_timer.stop()
                 self.setCursor(Qt.CursorShape.ClosedHandCursor)
 
-            # Pan if dragging and zoomed in
+            # Pan if dragging and zoomed in, coalesced to the latest offset
             if self._is_dragging and self._viewport_state.zoom_level > 1.0:
-                # Calculate pan delta in normalized time
-                delta_x = delta.x()
-                time_delta = (
-                    delta_x / self.width()
-                ) * self._viewport_state.visible_duration
-                new_pan = self._drag_start_pan - time_delta
-                self._viewport_state.set_pan(new_pan)
+                self._pending_pan_dx = delta.x()
+                if not self._pan_timer.isActive():
+                    self._pan_timer.start()
                 event.accept()
 
+    @Slot()
+    def _flush_pan(self) -> None:
+        """Apply the latest drag offset to the viewport pan"""
+        if self._viewport_state is None:
+            return
+
+        # Calculate pan delta in normalized time
+        time_delta = (
+            self._pending_pan_dx / self.width()
+        ) * self._viewport_state.visible_duration
+        self._viewport_state.set_pan(self._drag_start_pan - time_delta)
+
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Handle mouse release - seek if not dragged
 
@@ -494,6 +679,13 @@ class SpectrogramWidget(QWidget):
                     event.position().x(), self.width()
                 )
                 self.seek_requested.emit(position)
+            elif self._is_dragging:
+                self._settle_timer.start()
+
+            # Land on the final drag position
+            if self._pan_timer.isActive():
+                self._pan_timer.stop()
+                self._flush_pan()
 
             # Reset state
             self._mouse_press_pos = None
@@ -510,12 +702,42 @@ class SpectrogramWidget(QWidget):
             self._viewport_state.reset()
             event.accept()
 
+    def _update_fonts(self) -> None:
+        """Derive the label and message fonts from the widget font"""
+        self._label_font = QFont(self.font())
+        self._label_font.setPointSize(8)
+        self._message_font = QFont(self.font())
+        self._message_font.setPointSize(12)
+        self._indicator_font = QFont(self.font())
+        self._indicator_font.setPointSize(14)
+
+        # Right edge of the frequency labels (drawn from x=5)
+        metrics = QFontMetrics(self._label_font)
+        self._label_extent = 5 + max(
+            metrics.horizontalAdvance(text) for text in _FREQ_LABEL_TEXTS
+        )
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Refresh cached fonts when the widget font changes
+
+        Args:
+            event: Change event
+        """
+        if event.type() == QEvent.Type.FontChange:
+            self._update_fonts()
+        super().changeEvent(event)
+
+    @Slot()
+    def _on_interaction_settled(self) -> None:
+        """Redraw with smooth scaling once panning/zooming has stopped"""
+        self._interactive = False
+        self.update()
+
     def resizeEvent(self, event) -> None:
-        """Handle widget resize - invalidate cached image
+        """Handle widget resize - invalidate cached grid
 
         Args:
             event: Resize event
         """
         super().resizeEvent(event)
-        # Invalidate cache on resize so it gets regenerated at new size
-        self._cached_image = None
+        self._grid_pixmap = None
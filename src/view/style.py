@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication, QStyle
 
@@ -24,8 +26,9 @@ class AppStyle:
     }
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_stylesheet() -> str:
-        """Get application-wide QSS stylesheet
+        """Get application-wide QSS stylesheet (built once, COLORS is fixed)
 
         Returns:
             QSS stylesheet string
@@ -1,8 +1,18 @@
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
-from PySide6.QtCore import QPointF, QRect, Qt, Signal
-from PySide6.QtGui import QBrush, QColor, QMouseEvent, QPainter, QPaintEvent, QPen, QWheelEvent
+from PySide6.QtCore import QLine, QPointF, QRect, QRectF, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QImage,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPen,
+    QPixmap,
+    QWheelEvent,
+)
 from PySide6.QtWidgets import QWidget
 
 from src.view.style import AppStyle
@@ -27,9 +37,23 @@ class WaveformWidget(QWidget):
 
         # Waveform data
         self._waveform_data: Optional[np.ndarray] = None
+        # Data normalized to its peak once, plus max-pooled copies at 1/2,
+        # 1/4, ... resolution, so zoomed-out views read a level near screen size
+        self._mipmaps: List[np.ndarray] = []
         self._playback_position = 0.0  # 0.0 to 1.0
         self._is_recording = False
         self._recording_buffer: Optional[np.ndarray] = None  # Live recording data
+        # Live bars are written as pixels into this buffer, which _live_image
+        # wraps without copying
+        self._live_buf: Optional[np.ndarray] = None
+        self._live_image: Optional[QImage] = None
+        self._painted_pos_x: Optional[int] = None  # Line x in the last paint
+
+        # Background, grid and bars rendered once per data/size/viewport, so
+        # position ticks only blit it and draw the indicator
+        self._waveform_cache: Optional[QPixmap] = None
+        self._cache_key: Optional[tuple] = None
+        self._grid_pixmap: Optional[QPixmap] = None  # Rendered once per size
 
         # Viewport state (for zoom/pan)
         self._viewport_state: Optional["ViewportState"] = None
@@ -39,18 +63,44 @@ class WaveformWidget(QWidget):
         self._is_dragging = False
         self._drag_start_pan = 0.0
 
+        # Drag pans are applied at most once per ~frame
+        self._pending_pan_dx = 0.0
+        self._pan_timer = QTimer(self)
+        self._pan_timer.setSingleShot(True)
+        self._pan_timer.setInterval(8)
+        self._pan_timer.timeout.connect(self._flush_pan)
+
+        # Position ticks and live recording levels repaint at most once per
+        # ~frame, however fast they arrive
+        self._full_repaint = False  # Whole widget needed, not just the cursor
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._flush_repaint)
+
         # Visual settings
         self._bar_color = QColor(AppStyle.get_color("primary"))
         self._background_color = QColor(AppStyle.get_color("surface"))
         self._position_color = QColor(AppStyle.get_color("accent"))
         self._grid_color = QColor(AppStyle.get_color("border"))
+        self._placeholder_color = QColor(AppStyle.get_color("text_secondary"))
+
+        # Pens and brushes reused by every paint
+        self._grid_pen = QPen(self._grid_color, 1, Qt.PenStyle.DotLine)
+        self._bar_brush = QBrush(self._bar_color)
+        self._recording_pen = QPen(self._bar_color, 2)
+        self._placeholder_pen = QPen(self._placeholder_color, 1)
+        self._position_pen = QPen(self._position_color, 2)
+        self._position_brush = QBrush(self._position_color)
+
+        # Every paint covers the whole widget, so Qt needn't clear it first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
 
         # Set minimum size
         self.setMinimumHeight(120)
         self.setMinimumWidth(400)
-
-        # Enable mouse tracking
-        self.setMouseTracking(True)
+        # No mouse tracking: move events are only acted on while a button is
+        # held (drag panning), which Qt delivers without it
 
     def set_waveform_data(self, data: Optional[np.ndarray]) -> None:
         """Set waveform data to display
@@ -58,9 +108,42 @@ class WaveformWidget(QWidget):
         Args:
             data: Numpy array of amplitude values
         """
+        # Amplitudes are only drawn, so float32 is plenty and halves what the
+        # normalize/pool passes read (no copy if already float32)
+        if data is not None:
+            data = np.asarray(data, dtype=np.float32)
         self._waveform_data = data
+        self._mipmaps = []
+        if data is not None and len(data) > 0:
+            # Renders slice ready-normalized levels instead of dividing each time
+            peak = float(np.max(data))
+            normalized = np.divide(data, np.float32(peak if peak > 0 else 1.0))
+            self._mipmaps = self._build_mipmaps(normalized)
+        self._waveform_cache = None
         self.update()
 
+    @staticmethod
+    def _build_mipmaps(data: np.ndarray) -> List[np.ndarray]:
+        """Build the max-pooled levels of the waveform
+
+        Args:
+            data: Numpy array of amplitude values
+
+        Returns:
+            Levels from full resolution down to 256 or fewer values
+        """
+        levels = [data]
+        level = data
+        while len(level) > 256:
+            # Each value covers two of the finer level; an odd tail is kept
+            pairs = len(level) // 2
+            coarser = np.maximum(level[0 : 2 * pairs : 2], level[1 : 2 * pairs : 2])
+            if len(level) % 2:
+                coarser = np.append(coarser, level[-1])
+            levels.append(coarser)
+            level = coarser
+        return levels
+
     def set_playback_position(self, position: float) -> None:
         """Set playback position indicator
 
@@ -68,7 +151,7 @@ class WaveformWidget(QWidget):
             position: Position from 0.0 to 1.0
         """
         self._playback_position = max(0.0, min(1.0, position))
-        self.update()
+        self._schedule_repaint()
 
     def set_recording_mode(self, is_recording: bool) -> None:
         """Set recording mode
@@ -79,6 +162,7 @@ class WaveformWidget(QWidget):
         self._is_recording = is_recording
         if is_recording:
             self._waveform_data = None
+            self._mipmaps = []
             self._recording_buffer = None
         else:
             self._recording_buffer = None
@@ -91,7 +175,37 @@ class WaveformWidget(QWidget):
             data: Numpy array of recent audio levels
         """
         self._recording_buffer = data
-        self.update()
+        self._schedule_repaint(full=True)
+
+    def _schedule_repaint(self, full: bool = False) -> None:
+        """Queue a coalesced repaint
+
+        Args:
+            full: True to repaint the whole widget, else only the cursor
+        """
+        # A hidden widget gets a full paint when shown, so skip the timer
+        if not self.isVisible():
+            return
+
+        self._full_repaint = self._full_repaint or full
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    @Slot()
+    def _flush_repaint(self) -> None:
+        """Apply the latest queued position / recording buffer change"""
+        if self._full_repaint:
+            self._full_repaint = False
+            self.update()
+            return
+
+        # Repaint only the strips under the old and new indicator
+        x = self._position_x()
+        if x == self._painted_pos_x:
+            return
+        for strip_x in (self._painted_pos_x, x):
+            if strip_x is not None:
+                self.update(QRect(strip_x - 9, 0, 19, self.height()))
 
     def set_viewport_state(self, viewport_state: Optional["ViewportState"]) -> None:
         """Set viewport state for zoom/pan functionality
@@ -102,20 +216,40 @@ class WaveformWidget(QWidget):
         # Disconnect from old viewport state
         if self._viewport_state:
             try:
-                self._viewport_state.viewport_changed.disconnect(self.update)
+                self._viewport_state.viewport_changed.disconnect(
+                    self._on_viewport_changed
+                )
             except RuntimeError:
                 pass  # Already disconnected
 
         # Connect to new viewport state
         self._viewport_state = viewport_state
         if viewport_state:
-            viewport_state.viewport_changed.connect(self.update)
+            viewport_state.viewport_changed.connect(self._on_viewport_changed)
 
         self.update()
 
+    @Slot()
+    def _on_viewport_changed(self) -> None:
+        """Repaint for a pan/zoom only if it changes what is drawn"""
+        if (
+            self._waveform_cache is None
+            or self._waveform_data is None
+            or len(self._waveform_data) == 0
+        ):
+            self.update()
+            return
+
+        # Pans of less than one waveform value show the same bars
+        key = (self.width(), self.height(), *self._visible_range())
+        if key != self._cache_key or self._position_x() != self._painted_pos_x:
+            self.update()
+
     def clear(self) -> None:
         """Clear waveform display"""
         self._waveform_data = None
+        self._mipmaps = []
+        self._waveform_cache = None
         self._playback_position = 0.0
         self._is_recording = False
         self._recording_buffer = None
@@ -127,43 +261,78 @@ class WaveformWidget(QWidget):
         Args:
             event: Paint event
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Draw background
-        painter.fillRect(self.rect(), self._background_color)
+        if not self.isVisible() or self.width() <= 0 or self.height() <= 0:
+            return
 
-        # Draw grid lines
-        self._draw_grid(painter)
+        # No Antialiasing hint: bars, grid and indicator line are axis-aligned,
+        # only the indicator triangle turns it on
+        painter = QPainter(self)
 
         # Draw waveform
         if self._waveform_data is not None and len(self._waveform_data) > 0:
-            self._draw_waveform(painter)
-        elif self._is_recording:
-            self._draw_recording_indicator(painter)
+            self._draw_cached_waveform(painter)
         else:
-            self._draw_placeholder(painter)
+            # Draw background and grid lines
+            painter.fillRect(self.rect(), self._background_color)
+            self._draw_grid(painter)
+            if self._is_recording:
+                self._draw_recording_indicator(painter)
+            else:
+                self._draw_placeholder(painter)
 
         # Draw playback position
-        if self._playback_position > 0.0 and not self._is_recording:
-            self._draw_position_indicator(painter)
+        self._painted_pos_x = self._position_x()
+        if self._painted_pos_x is not None:
+            self._draw_position_indicator(painter, self._painted_pos_x)
+
+    def _draw_cached_waveform(self, painter: QPainter) -> None:
+        """Blit the waveform pixmap, rendering it first if it is stale
+
+        Args:
+            painter: QPainter object
+        """
+        key = (self.width(), self.height(), *self._visible_range())
+        if self._waveform_cache is None or key != self._cache_key:
+            dpr = self.devicePixelRatioF()
+            self._waveform_cache = QPixmap(self.size() * dpr)
+            self._waveform_cache.setDevicePixelRatio(dpr)
+            self._cache_key = key
+
+            cache_painter = QPainter(self._waveform_cache)
+            cache_painter.fillRect(self.rect(), self._background_color)
+            self._draw_grid(cache_painter)
+            self._draw_waveform(cache_painter)
+            cache_painter.end()
+
+        painter.drawPixmap(0, 0, self._waveform_cache)
 
     def _draw_grid(self, painter: QPainter) -> None:
-        """Draw grid lines
+        """Draw grid lines from a pixmap rendered once per widget size
 
         Args:
             painter: QPainter object
         """
-        painter.setPen(QPen(self._grid_color, 1, Qt.PenStyle.DotLine))
+        if self._grid_pixmap is None:
+            dpr = self.devicePixelRatioF()
+            self._grid_pixmap = QPixmap(self.size() * dpr)
+            self._grid_pixmap.setDevicePixelRatio(dpr)
+            self._grid_pixmap.fill(Qt.GlobalColor.transparent)
+
+            grid_painter = QPainter(self._grid_pixmap)
+            grid_painter.setPen(self._grid_pen)
+            width = self.width()
+            height = self.height()
 
-        # Horizontal center line
-        center_y = self.height() // 2
-        painter.drawLine(0, center_y, self.width(), center_y)
+            # Horizontal center line and vertical time markers, in one call
+            center_y = height // 2
+            lines = [QLine(0, center_y, width, center_y)]
+            for i in range(1, 10):
+                x = int(width * i / 10)
+                lines.append(QLine(x, 0, x, height))
+            grid_painter.drawLines(lines)
+            grid_painter.end()
 
-        # Vertical lines (time markers)
-        for i in range(1, 10):
-            x = int(self.width() * i / 10)
-            painter.drawLine(x, 0, x, self.height())
+        painter.drawPixmap(0, 0, self._grid_pixmap)
 
     def _draw_waveform(self, painter: QPainter) -> None:
         """Draw waveform bars with viewport support
@@ -174,10 +343,28 @@ class WaveformWidget(QWidget):
         if self._waveform_data is None or len(self._waveform_data) == 0:
             return
 
-        width = self.width()
-        height = self.height()
-        center_y = height / 2
+        start_idx, end_idx = self._visible_range()
+
+        # Read the coarsest level that still has a value per pixel column;
+        # _draw_bars pools what is left down to the widget width
+        buckets = (end_idx - start_idx) // max(1, self.width())
+        level = min(max(0, buckets.bit_length() - 1), len(self._mipmaps) - 1)
+        step = 1 << level
+        first = start_idx >> level
+        last = max(first + 1, (end_idx + step - 1) >> level)
+        normalized = self._mipmaps[level][first:last]  # View, no copy
 
+        # Draw bars
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._bar_brush)
+        self._draw_bars(painter, normalized)
+
+    def _visible_range(self) -> Tuple[int, int]:
+        """Work out which waveform values the viewport shows
+
+        Returns:
+            Start and end index into the waveform data (end exclusive)
+        """
         # Get visible data range based on viewport
         total_bars = len(self._waveform_data)
         if self._viewport_state:
@@ -191,41 +378,99 @@ class WaveformWidget(QWidget):
 
             start_idx = max(0, min(start_idx, total_bars - 1))
             end_idx = max(start_idx + 1, min(end_idx, total_bars))
-            visible_data = self._waveform_data[start_idx:end_idx]
-        else:
-            visible_data = self._waveform_data
+            return start_idx, end_idx
+        return 0, total_bars
 
-        # Calculate bar width based on visible data
-        num_bars = len(visible_data)
-        if num_bars == 0:
-            return
+    def _draw_bars(self, painter: QPainter, amplitudes: np.ndarray) -> None:
+        """Draw one vertically centered bar per amplitude across the width
+
+        Args:
+            painter: QPainter object with the bar brush set
+            amplitudes: Normalized amplitudes (0-1)
+        """
+        xs, tops, spans, bar_width = self._bar_geometry(amplitudes)
+
+        # Skip bars that would cover no pixels: silent ones and any rounded
+        # past the right edge
+        keep = (spans >= 1) & (xs < self.width())
+        xs, tops, spans = xs[keep], tops[keep], spans[keep]
+
+        # One drawRects call for all bars, in the float coordinates QPainter
+        # works in anyway
+        rects = [
+            QRectF(x, top, bar_width, span)
+            for x, top, span in zip(xs.tolist(), tops.tolist(), spans.tolist())
+        ]
+        painter.drawRects(rects)
+
+    def _draw_live_bars(self, painter: QPainter, amplitudes: np.ndarray) -> None:
+        """Draw the live recording bars as one image
+
+        The bars change with every level update, so they are written as a pixel
+        mask into a persistent ARGB buffer rather than rasterized as rects.
+
+        Args:
+            painter: QPainter object
+            amplitudes: Normalized amplitudes (0-1)
+        """
+        width = self.width()
+        height = self.height()
+        xs, tops, spans, bar_width = self._bar_geometry(amplitudes)
+
+        if self._live_buf is None or self._live_buf.shape != (height, width):
+            self._live_buf = np.empty((height, width), dtype=np.uint32)
+            self._live_image = QImage(
+                self._live_buf.data,
+                width,
+                height,
+                width * 4,
+                QImage.Format.Format_ARGB32_Premultiplied,
+            )
+
+        # Vertical extent of the bar covering each pixel column (none in gaps).
+        # A pixel is covered when its center is, as when QPainter fills rects
+        centers = np.arange(width) + 0.5
+        bar = np.maximum(np.searchsorted(xs, centers, side="right") - 1, 0)
+        covered = (centers >= xs[bar]) & (centers < xs[bar] + bar_width)
+        column_tops = np.where(covered, tops[bar], 0.0)
+        column_bottoms = np.where(covered, tops[bar] + spans[bar], 0.0)
+
+        rows = np.arange(height)[:, None] + 0.5
+        mask = (rows >= column_tops) & (rows < column_bottoms)
+        self._live_buf.fill(0)  # Transparent, so the grid shows through
+        self._live_buf[mask] = self._position_color.rgba()
+        painter.drawImage(0, 0, self._live_image)
+
+    def _bar_geometry(
+        self, amplitudes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """Lay out one vertically centered bar per amplitude across the width
+
+        Args:
+            amplitudes: Normalized amplitudes (0-1)
+
+        Returns:
+            Bar left x, top y and height arrays, and the bar width
+        """
+        width = self.width()
+        height = self.height()
+        center_y = height / 2
+
+        # More bars than pixels would overlap, so bucket them into one bar per
+        # pixel column; the max keeps peaks visible
+        if len(amplitudes) > width > 0:
+            edges = np.linspace(0, len(amplitudes), width + 1).astype(np.int64)
+            amplitudes = np.maximum.reduceat(amplitudes, edges[:-1])
 
+        # Calculate bar width based on the number of bars
+        num_bars = len(amplitudes)
         bar_width = max(1, width / num_bars)
         spacing = max(0, bar_width * 0.2) if bar_width > 2 else 0
         actual_bar_width = max(1, bar_width - spacing)
 
-        # Normalize waveform data
-        max_amplitude = (
-            np.max(self._waveform_data) if np.max(self._waveform_data) > 0 else 1.0
-        )
-        normalized = visible_data / max_amplitude
-
-        # Draw bars
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(self._bar_color))
-
-        for i, amplitude in enumerate(normalized):
-            x = i * bar_width
-            bar_height = amplitude * (height / 2) * 0.9  # 90% of half height
-
-            # Draw bar (centered vertically)
-            rect = QRect(
-                int(x),
-                int(center_y - bar_height),
-                int(actual_bar_width),
-                int(bar_height * 2),
-            )
-            painter.drawRect(rect)
+        bar_heights = amplitudes * (height / 2 * 0.9)  # 90% of half height
+        xs = np.arange(num_bars) * bar_width
+        return xs, center_y - bar_heights, bar_heights * 2, actual_bar_width
 
     def _draw_recording_indicator(self, painter: QPainter) -> None:
         """Draw recording indicator with live waveform if available
@@ -235,41 +480,12 @@ class WaveformWidget(QWidget):
         """
         # If we have recording buffer data, draw it as a live waveform
         if self._recording_buffer is not None and len(self._recording_buffer) > 0:
-            # Use the same drawing logic as regular waveform
-            width = self.width()
-            height = self.height()
-            center_y = height / 2
-
-            # Calculate bar width
-            num_bars = len(self._recording_buffer)
-            bar_width = max(1, width / num_bars)
-            spacing = max(0, bar_width * 0.2) if bar_width > 2 else 0
-            actual_bar_width = max(1, bar_width - spacing)
-
-            # Use recording buffer directly (already normalized 0-1)
-            normalized = self._recording_buffer
-
-            # Draw bars with accent color for recording
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(
-                QBrush(self._position_color)
-            )  # Orange/accent color for recording
-
-            for i, amplitude in enumerate(normalized):
-                x = i * bar_width
-                bar_height = amplitude * (height / 2) * 0.9  # 90% of half height
-
-                # Draw bar (centered vertically)
-                rect = QRect(
-                    int(x),
-                    int(center_y - bar_height),
-                    int(actual_bar_width),
-                    int(bar_height * 2),
-                )
-                painter.drawRect(rect)
+            # Draw bars with accent color for recording, using the recording
+            # buffer directly (already normalized 0-1)
+            self._draw_live_bars(painter, np.asarray(self._recording_buffer))
         else:
             # No data yet, show text indicator
-            painter.setPen(QPen(self._bar_color, 2))
+            painter.setPen(self._recording_pen)
             font = painter.font()
             font.setPointSize(14)
             painter.setFont(font)
@@ -283,7 +499,7 @@ class WaveformWidget(QWidget):
         Args:
             painter: QPainter object
         """
-        painter.setPen(QPen(QColor(AppStyle.get_color("text_secondary")), 1))
+        painter.setPen(self._placeholder_pen)
         font = painter.font()
         font.setPointSize(12)
         painter.setFont(font)
@@ -291,27 +507,36 @@ class WaveformWidget(QWidget):
         text = "No audio loaded"
         painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, text)
 
-    def _draw_position_indicator(self, painter: QPainter) -> None:
-        """Draw playback position indicator with viewport support
+    def _position_x(self) -> Optional[int]:
+        """Work out where the playback position indicator goes
 
-        Args:
-            painter: QPainter object
+        Returns:
+            Widget x of the indicator, or None if it isn't shown
         """
+        if self._playback_position <= 0.0 or self._is_recording:
+            return None
+
         # Use viewport transformation if available
         if self._viewport_state:
             # Only draw if position is visible in viewport
             if not self._viewport_state.is_time_visible(self._playback_position):
-                return
-            x = int(
+                return None
+            return int(
                 self._viewport_state.time_to_screen(
                     self._playback_position, self.width()
                 )
             )
-        else:
-            x = int(self.width() * self._playback_position)
+        return int(self.width() * self._playback_position)
 
+    def _draw_position_indicator(self, painter: QPainter, x: int) -> None:
+        """Draw playback position indicator
+
+        Args:
+            painter: QPainter object
+            x: Widget x of the indicator
+        """
         # Draw vertical line
-        painter.setPen(QPen(self._position_color, 2))
+        painter.setPen(self._position_pen)
         painter.drawLine(x, 0, x, self.height())
 
         # Draw triangle at top
@@ -321,9 +546,20 @@ class WaveformWidget(QWidget):
             QPointF(x - triangle_size, triangle_size),
             QPointF(x + triangle_size, triangle_size),
         ]
-        painter.setBrush(QBrush(self._position_color))
+        painter.setBrush(self._position_brush)
         painter.setPen(Qt.PenStyle.NoPen)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         painter.drawPolygon(points)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+    def resizeEvent(self, event) -> None:
+        """Handle widget resize - invalidate cached grid
+
+        Args:
+            event: Resize event
+        """
+        super().resizeEvent(event)
+        self._grid_pixmap = None
 
     def wheelEvent(self, event: QWheelEvent) -> None:
         """Handle mouse wheel for zooming
@@ -342,9 +578,7 @@ class WaveformWidget(QWidget):
         # Zoom in/out based on wheel delta
         delta = event.angleDelta().y()
         zoom_factor = 1.1 if delta > 0 else 1 / 1.1
-        new_zoom = np.clip(
-            self._viewport_state.zoom_level * zoom_factor, 1.0, 50.0
-        )
+        new_zoom = max(1.0, min(50.0, self._viewport_state.zoom_level * zoom_factor))
 
         self._viewport_state.set_zoom(new_zoom, center_time)
         event.accept()
@@ -374,17 +608,25 @@ class WaveformWidget(QWidget):
                 self._is_dragging = True
                 self.setCursor(Qt.CursorShape.ClosedHandCursor)
 
-            # Pan if dragging and zoomed in
+            # Pan if dragging and zoomed in, coalesced to the latest offset
             if self._is_dragging and self._viewport_state.zoom_level > 1.0:
-                # Calculate pan delta in normalized time
-                delta_x = delta.x()
-                time_delta = (
-                    delta_x / self.width()
-                ) * self._viewport_state.visible_duration
-                new_pan = self._drag_start_pan - time_delta
-                self._viewport_state.set_pan(new_pan)
+                self._pending_pan_dx = delta.x()
+                if not self._pan_timer.isActive():
+                    self._pan_timer.start()
                 event.accept()
 
+    @Slot()
+    def _flush_pan(self) -> None:
+        """Apply the latest drag offset to the viewport pan"""
+        if self._viewport_state is None:
+            return
+
+        # Calculate pan delta in normalized time
+        time_delta = (
+            self._pending_pan_dx / self.width()
+        ) * self._viewport_state.visible_duration
+        self._viewport_state.set_pan(self._drag_start_pan - time_delta)
+
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Handle mouse release - seek if not dragged
 
@@ -399,6 +641,11 @@ class WaveformWidget(QWidget):
                 )
                 self.seek_requested.emit(position)
 
+            # Land on the final drag position
+            if self._pan_timer.isActive():
+                self._pan_timer.stop()
+                self._flush_pan()
+
             # Reset state
             self._mouse_press_pos = None
             self._is_dragging = False